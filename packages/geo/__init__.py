@@ -1,5 +1,5 @@
 """Geocoding and spatial utilities."""
 
-from .geocode import GeoUtils, GridIndex
+from .geocode import GeoUtils, GridIndex, KDIndex
 
-__all__ = ["GeoUtils", "GridIndex"]
+__all__ = ["GeoUtils", "GridIndex", "KDIndex"]
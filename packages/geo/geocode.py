@@ -4,11 +4,68 @@ import math
 from typing import List, Tuple, Dict, Set
 from collections import defaultdict
 
+import numpy as np
+from scipy.spatial import cKDTree
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator used when numba is not installed."""
+
+        def wrapper(func):
+            return func
+
+        return wrapper
+
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True, fastmath=True)
+def _haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Scalar Haversine kernel (JIT-compiled when numba is available).
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lng1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lng2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1_rad = np.radians(lat1)
+    lng1_rad = np.radians(lng1)
+    lat2_rad = np.radians(lat2)
+    lng2_rad = np.radians(lng2)
+
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+    )
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT cache at import time so the one-off compile cost doesn't
+    # land in the middle of a hot query loop.
+    _haversine(0.0, 0.0, 0.0, 0.0)
+
 
 class GeoUtils:
     """Geographic utility functions."""
 
-    EARTH_RADIUS_KM = 6371.0
+    EARTH_RADIUS_KM = EARTH_RADIUS_KM
 
     @staticmethod
     def haversine_distance(
@@ -25,21 +82,45 @@ class GeoUtils:
         Returns:
             Distance in kilometers
         """
-        lat1_rad = math.radians(lat1)
-        lng1_rad = math.radians(lng1)
-        lat2_rad = math.radians(lat2)
-        lng2_rad = math.radians(lng2)
+        return float(_haversine(lat1, lng1, lat2, lng2))
 
-        dlat = lat2_rad - lat1_rad
-        dlng = lng2_rad - lng1_rad
+    @staticmethod
+    def haversine_from(center_lat: float, center_lng: float):
+        """Build a distance function specialized for a fixed center.
 
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
+        Partial evaluation for callers that measure many points against
+        one location: the center's radians and cosine are computed once
+        and bound into the returned closure, saving two trig calls per
+        distance evaluation.
+
+        Args:
+            center_lat: Center latitude (degrees)
+            center_lng: Center longitude (degrees)
 
-        return GeoUtils.EARTH_RADIUS_KM * c
+        Returns:
+            Function (lat, lng) -> distance in kilometers
+        """
+        clat_rad = math.radians(center_lat)
+        clng_rad = math.radians(center_lng)
+        cos_clat = math.cos(clat_rad)
+        diameter = 2 * EARTH_RADIUS_KM
+        sin = math.sin
+        cos = math.cos
+        asin = math.asin
+        sqrt = math.sqrt
+        radians = math.radians
+
+        def distance_to(lat: float, lng: float) -> float:
+            lat_rad = radians(lat)
+            dlat = lat_rad - clat_rad
+            dlng = radians(lng) - clng_rad
+            a = (
+                sin(dlat / 2) ** 2
+                + cos_clat * cos(lat_rad) * sin(dlng / 2) ** 2
+            )
+            return diameter * asin(sqrt(a))
+
+        return distance_to
 
     @staticmethod
     def bounding_box(
@@ -65,6 +146,43 @@ class GeoUtils:
             center_lng + lng_delta,
         )
 
+    @staticmethod
+    def points_in_radius_arr(
+        center_lat: float,
+        center_lng: float,
+        radius_km: float,
+        lats: np.ndarray,
+        lngs: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized radius query over SoA coordinate arrays.
+
+        Args:
+            center_lat: Center latitude (degrees)
+            center_lng: Center longitude (degrees)
+            radius_km: Search radius in kilometers
+            lats: Latitudes of candidate points (degrees)
+            lngs: Longitudes of candidate points (degrees)
+
+        Returns:
+            (indices, distances) arrays for points within radius
+        """
+        clat = math.radians(center_lat)
+        clng = math.radians(center_lng)
+        lats_rad = np.radians(lats)
+        lngs_rad = np.radians(lngs)
+
+        dlat = lats_rad - clat
+        dlng = lngs_rad - clng
+
+        a = (
+            np.sin(dlat * 0.5) ** 2
+            + math.cos(clat) * np.cos(lats_rad) * np.sin(dlng * 0.5) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+        indices = np.nonzero(distances <= radius_km)[0]
+        return indices, distances[indices]
+
     @staticmethod
     def points_in_radius(
         center: Tuple[float, float],
@@ -81,17 +199,57 @@ class GeoUtils:
         Returns:
             List of (index, distance) tuples for points within radius
         """
-        result = []
-        center_lat, center_lng = center
+        if not points:
+            return []
 
-        for i, (lat, lng) in enumerate(points):
-            distance = GeoUtils.haversine_distance(
-                center_lat, center_lng, lat, lng
-            )
-            if distance <= radius_km:
-                result.append((i, distance))
+        coords = np.asarray(points, dtype=np.float64)
+        indices, distances = GeoUtils.points_in_radius_arr(
+            center[0], center[1], radius_km, coords[:, 0], coords[:, 1]
+        )
 
-        return result
+        return [(int(i), float(d)) for i, d in zip(indices, distances)]
+
+
+class _CellBuffer:
+    """Struct-of-arrays point storage for a single grid cell.
+
+    Points are appended to plain Python lists; NumPy views are built
+    lazily on first query and invalidated when the cell grows.
+    """
+
+    __slots__ = ("indices", "lats", "lngs", "_arrays")
+
+    def __init__(self):
+        self.indices: List[int] = []
+        self.lats: List[float] = []
+        self.lngs: List[float] = []
+        self._arrays = None
+
+    def append(self, index: int, lat: float, lng: float) -> None:
+        """Append a point to the cell."""
+        self.indices.append(index)
+        self.lats.append(lat)
+        self.lngs.append(lng)
+        self._arrays = None
+
+    def extend(
+        self, indices: List[int], lats: List[float], lngs: List[float]
+    ) -> None:
+        """Append a batch of points to the cell."""
+        self.indices.extend(indices)
+        self.lats.extend(lats)
+        self.lngs.extend(lngs)
+        self._arrays = None
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get (indices, lats, lngs) arrays, materializing them if needed."""
+        if self._arrays is None:
+            self._arrays = (
+                np.asarray(self.indices, dtype=np.int64),
+                np.asarray(self.lats, dtype=np.float64),
+                np.asarray(self.lngs, dtype=np.float64),
+            )
+        return self._arrays
 
 
 class GridIndex:
@@ -104,11 +262,28 @@ class GridIndex:
             cell_size_km: Size of each grid cell in kilometers
         """
         self.cell_size_km = cell_size_km
-        self.grid: Dict[Tuple[int, int], List[Tuple[int, Tuple[float, float]]]] = (
-            defaultdict(list)
-        )
+        # Each degree of latitude ≈ 111 km; precompute cells-per-degree once
+        # so cell keys are a multiply instead of two divisions per point.
+        self._cells_per_degree = 111.0 / cell_size_km
+        self.grid: Dict[int, _CellBuffer] = defaultdict(_CellBuffer)
+
+    @staticmethod
+    def _pack_key(cell_x: int, cell_y: int) -> int:
+        """Pack cell coordinates into a single int key.
 
-    def _get_cell_key(self, lat: float, lng: float) -> Tuple[int, int]:
+        A plain int hashes in one C-level op, versus two element hashes
+        plus a combine for a (cell_x, cell_y) tuple.
+
+        Args:
+            cell_x: Cell x coordinate
+            cell_y: Cell y coordinate
+
+        Returns:
+            Packed key with cell_y in the high 32 bits
+        """
+        return (cell_y << 32) | (cell_x & 0xFFFFFFFF)
+
+    def _get_cell_key(self, lat: float, lng: float) -> int:
         """Get grid cell key for a location.
 
         Args:
@@ -116,14 +291,18 @@ class GridIndex:
             lng: Longitude
 
         Returns:
-            (cell_x, cell_y) tuple
+            Packed cell key
         """
-        # Each degree of latitude ≈ 111 km
-        cell_y = int(lat / (self.cell_size_km / 111.0))
+        # floor (not int()) so cells are consistent half-open intervals
+        # in both hemispheres; truncation toward zero flips the interval
+        # for negative coordinates and breaks the queries' row math
+        cell_y = math.floor(lat * self._cells_per_degree)
         # Each degree of longitude varies by latitude
-        cell_x = int(lng / (self.cell_size_km / (111.0 * math.cos(math.radians(lat)))))
+        cell_x = math.floor(
+            lng * math.cos(math.radians(lat)) * self._cells_per_degree
+        )
 
-        return (cell_x, cell_y)
+        return self._pack_key(cell_x, cell_y)
 
     def add_point(self, index: int, location: Tuple[float, float]) -> None:
         """Add a point to the index.
@@ -134,16 +313,47 @@ class GridIndex:
         """
         lat, lng = location
         cell_key = self._get_cell_key(lat, lng)
-        self.grid[cell_key].append((index, location))
+        self.grid[cell_key].append(index, lat, lng)
 
     def add_points(self, locations: List[Tuple[float, float]]) -> None:
         """Add multiple points to the index.
 
+        Cell keys are computed for the whole batch with NumPy and points
+        are grouped by cell via one argsort, so ingestion does one dict
+        lookup per occupied cell instead of one per point.
+
         Args:
             locations: List of (latitude, longitude) tuples
         """
-        for i, location in enumerate(locations):
-            self.add_point(i, location)
+        if not locations:
+            return
+
+        coords = np.asarray(locations, dtype=np.float64)
+        lats = coords[:, 0]
+        lngs = coords[:, 1]
+
+        # Same floor keying as _get_cell_key (astype would truncate
+        # toward zero and disagree for negative coordinates)
+        cell_y = np.floor(lats * self._cells_per_degree).astype(np.int64)
+        cell_x = np.floor(
+            lngs * np.cos(np.radians(lats)) * self._cells_per_degree
+        ).astype(np.int64)
+
+        # Pack both cell coordinates into one sortable key and slice the
+        # sorted order into contiguous per-cell runs
+        keys = (cell_y << 32) | (cell_x & 0xFFFFFFFF)
+        order = np.argsort(keys, kind="stable")
+        sorted_keys = keys[order]
+        run_starts = np.nonzero(
+            np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        )[0]
+        run_ends = np.r_[run_starts[1:], len(order)]
+
+        for start, end in zip(run_starts, run_ends):
+            members = order[start:end]
+            self.grid[int(sorted_keys[start])].extend(
+                members.tolist(), lats[members].tolist(), lngs[members].tolist()
+            )
 
     def query_radius(
         self, center: Tuple[float, float], radius_km: float
@@ -160,25 +370,69 @@ class GridIndex:
         result = []
         center_lat, center_lng = center
 
-        # Get bounding box of cells to check
+        # Get bounding box of cells to check; the cosine of the center
+        # latitude is computed once and reused for all longitude bounds.
+        cos_c = math.cos(math.radians(center_lat))
         lat_delta = radius_km / 111.0
-        lng_delta = radius_km / (111.0 * math.cos(math.radians(center_lat)))
-        min_cell_lat = int((center_lat - lat_delta) / (self.cell_size_km / 111.0))
-        max_cell_lat = int((center_lat + lat_delta) / (self.cell_size_km / 111.0))
-        min_cell_lng = int((center_lng - lng_delta) / (self.cell_size_km / (111.0 * math.cos(math.radians(center_lat)))))
-        max_cell_lng = int((center_lng + lng_delta) / (self.cell_size_km / (111.0 * math.cos(math.radians(center_lat)))))
+        lng_delta = radius_km / (111.0 * cos_c)
+        min_cell_lat = math.floor(
+            (center_lat - lat_delta) * self._cells_per_degree
+        )
+        max_cell_lat = math.floor(
+            (center_lat + lat_delta) * self._cells_per_degree
+        )
+
+        # Equirectangular prefilter radius; 1% slack covers the error of
+        # the flat-earth approximation at city scales.
+        prefilter_r2 = (radius_km * 1.01) ** 2
+        lng_scale = cos_c * 111.0
 
         # Check all cells in bounding box
+        lng_lo = (center_lng - lng_delta) * self._cells_per_degree
+        lng_hi = (center_lng + lng_delta) * self._cells_per_degree
+
         for cell_y in range(min_cell_lat, max_cell_lat + 1):
+            # Longitude cell keys scale with each point's own latitude,
+            # which spans the whole row: take the extremes over both
+            # row-edge cosines (either sign of lng) and widen by one
+            # cell so no point keyed anywhere in the row is skipped.
+            cos_lo = math.cos(math.radians(cell_y / self._cells_per_degree))
+            cos_hi = math.cos(
+                math.radians((cell_y + 1) / self._cells_per_degree)
+            )
+            spans = (
+                lng_lo * cos_lo, lng_lo * cos_hi,
+                lng_hi * cos_lo, lng_hi * cos_hi,
+            )
+            min_cell_lng = math.floor(min(spans)) - 1
+            max_cell_lng = math.floor(max(spans)) + 1
+
             for cell_x in range(min_cell_lng, max_cell_lng + 1):
-                cell_key = (cell_x, cell_y)
+                cell_key = self._pack_key(cell_x, cell_y)
                 if cell_key in self.grid:
-                    for point_idx, location in self.grid[cell_key]:
-                        distance = GeoUtils.haversine_distance(
-                            center_lat, center_lng, location[0], location[1]
-                        )
-                        if distance <= radius_km:
-                            result.append((point_idx, distance))
+                    indices, lats, lngs = self.grid[cell_key].arrays()
+
+                    # Cheap squared-distance screen before the Haversine:
+                    # rejects most out-of-radius points without any trig
+                    dy = (lats - center_lat) * 111.0
+                    dx = (lngs - center_lng) * lng_scale
+                    candidates = np.nonzero(
+                        dx * dx + dy * dy <= prefilter_r2
+                    )[0]
+                    if candidates.size == 0:
+                        continue
+
+                    hits, distances = GeoUtils.points_in_radius_arr(
+                        center_lat,
+                        center_lng,
+                        radius_km,
+                        lats[candidates],
+                        lngs[candidates],
+                    )
+                    result.extend(
+                        (int(indices[candidates[h]]), float(d))
+                        for h, d in zip(hits, distances)
+                    )
 
         return result
 
@@ -196,27 +450,126 @@ class GridIndex:
         result = []
         min_lat, min_lng, max_lat, max_lng = bounds
 
-        # Get cell range
-        min_cell_lat = int(min_lat / (self.cell_size_km / 111.0))
-        max_cell_lat = int(max_lat / (self.cell_size_km / 111.0))
-        min_cell_lng = int(min_lng / (self.cell_size_km / (111.0 * math.cos(math.radians(min_lat)))))
-        max_cell_lng = int(max_lng / (self.cell_size_km / (111.0 * math.cos(math.radians(min_lat)))))
+        # Get cell range; the longitude products are loop-invariant up to
+        # the per-row cosine, so scale them once here
+        min_cell_lat = math.floor(min_lat * self._cells_per_degree)
+        max_cell_lat = math.floor(max_lat * self._cells_per_degree)
+        min_lng_scaled = min_lng * self._cells_per_degree
+        max_lng_scaled = max_lng * self._cells_per_degree
 
         # Check all cells
         for cell_y in range(min_cell_lat, max_cell_lat + 1):
+            # Longitude cell keys scale with each point's own latitude,
+            # which spans the whole row: take the extremes over both
+            # row-edge cosines (either sign of lng) and widen by one
+            # cell; the exact lat/lng mask below filters the false
+            # positives back out.
+            cos_lo = math.cos(math.radians(cell_y / self._cells_per_degree))
+            cos_hi = math.cos(
+                math.radians((cell_y + 1) / self._cells_per_degree)
+            )
+            spans = (
+                min_lng_scaled * cos_lo, min_lng_scaled * cos_hi,
+                max_lng_scaled * cos_lo, max_lng_scaled * cos_hi,
+            )
+            min_cell_lng = math.floor(min(spans)) - 1
+            max_cell_lng = math.floor(max(spans)) + 1
+
             for cell_x in range(min_cell_lng, max_cell_lng + 1):
-                cell_key = (cell_x, cell_y)
+                cell_key = self._pack_key(cell_x, cell_y)
                 if cell_key in self.grid:
-                    for point_idx, location in self.grid[cell_key]:
-                        lat, lng = location
-                        if (
-                            min_lat <= lat <= max_lat
-                            and min_lng <= lng <= max_lng
-                        ):
-                            result.append((point_idx, location))
+                    indices, lats, lngs = self.grid[cell_key].arrays()
+                    inside = np.nonzero(
+                        (lats >= min_lat)
+                        & (lats <= max_lat)
+                        & (lngs >= min_lng)
+                        & (lngs <= max_lng)
+                    )[0]
+                    result.extend(
+                        (int(indices[h]), (float(lats[h]), float(lngs[h])))
+                        for h in inside
+                    )
 
         return result
 
     def clear(self) -> None:
         """Clear the index."""
         self.grid.clear()
+
+
+class KDIndex:
+    """KD-tree spatial index for variable-density point sets.
+
+    GridIndex assumes roughly uniform density: sparse regions waste
+    cells and dense ones degrade to linear scans. KDIndex embeds the
+    points on the unit sphere and answers radius queries in O(log N)
+    through a cKDTree, independent of how the points cluster.
+    """
+
+    def __init__(self, points: List[Tuple[float, float]]):
+        """Build the index.
+
+        Args:
+            points: List of (latitude, longitude) tuples
+        """
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self._lats = coords[:, 0]
+        self._lngs = coords[:, 1]
+        self._tree = cKDTree(self._to_unit_xyz(self._lats, self._lngs))
+
+    @staticmethod
+    def _to_unit_xyz(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """Embed (lat, lng) degrees as points on the unit sphere."""
+        lat_rad = np.radians(lats)
+        lng_rad = np.radians(lngs)
+        cos_lat = np.cos(lat_rad)
+        return np.column_stack(
+            (
+                cos_lat * np.cos(lng_rad),
+                cos_lat * np.sin(lng_rad),
+                np.sin(lat_rad),
+            )
+        )
+
+    def query_radius(
+        self, center: Tuple[float, float], radius_km: float
+    ) -> List[Tuple[int, float]]:
+        """Query points within a radius.
+
+        Args:
+            center: Center point (lat, lng)
+            radius_km: Search radius in kilometers
+
+        Returns:
+            List of (index, distance) tuples
+        """
+        center_lat, center_lng = center
+
+        # The great-circle radius corresponds to a chord length on the
+        # unit sphere, so the Euclidean ball query is exact
+        arc = min(radius_km / EARTH_RADIUS_KM, math.pi)
+        chord = 2.0 * math.sin(arc / 2.0)
+
+        xyz = self._to_unit_xyz(
+            np.array([center_lat]), np.array([center_lng])
+        )[0]
+        candidates = self._tree.query_ball_point(xyz, chord)
+        if not candidates:
+            return []
+
+        candidates = np.asarray(candidates, dtype=np.int64)
+        hits, distances = GeoUtils.points_in_radius_arr(
+            center_lat,
+            center_lng,
+            radius_km,
+            self._lats[candidates],
+            self._lngs[candidates],
+        )
+
+        return [
+            (int(candidates[h]), float(d)) for h, d in zip(hits, distances)
+        ]
+
+    def __len__(self) -> int:
+        """Number of indexed points."""
+        return self._lats.shape[0]
@@ -2,6 +2,6 @@
 
 from .engine import SimulationEngine, Event, EventType
 from .scenarios import ScenarioGenerator, Scenario
-from .metrics import SimulationMetrics
+from .metrics import SimulationMetrics, DelayAccumulator
 
-__all__ = ["SimulationEngine", "Event", "EventType", "ScenarioGenerator", "Scenario", "SimulationMetrics"]
+__all__ = ["SimulationEngine", "Event", "EventType", "ScenarioGenerator", "Scenario", "SimulationMetrics", "DelayAccumulator"]
@@ -1,8 +1,10 @@
 """Discrete-event simulation engine."""
 
+import bisect
 import heapq
+import itertools
 from dataclasses import dataclass, field
-from typing import List, Callable, Optional, Dict, Any
+from typing import List, Callable, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import random
@@ -21,18 +23,50 @@ class EventType(str, Enum):
     SIMULATION_END = "simulation_end"
 
 
-@dataclass
+class OrderArrivalPayload:
+    """Payload for order arrival events."""
+
+    __slots__ = ("location", "weight", "volume")
+
+    def __init__(self, location: tuple, weight: float, volume: float):
+        self.location = location
+        self.weight = weight
+        self.volume = volume
+
+
+class VehicleStopPayload:
+    """Payload for pickup/delivery events."""
+
+    __slots__ = ("vehicle_id", "location")
+
+    def __init__(self, vehicle_id: str, location: Optional[tuple] = None):
+        self.vehicle_id = vehicle_id
+        self.location = location
+
+
+@dataclass(slots=True)
 class Event:
-    """Simulation event."""
+    """Simulation event.
+
+    ``data`` holds a typed slots payload (OrderArrivalPayload /
+    VehicleStopPayload) rather than a dict: with millions of events the
+    per-event dict allocation and its ~200 bytes are the dominant memory
+    cost.
+    """
 
     time: float  # Simulation time in minutes
     event_type: EventType
     entity_id: str  # Order ID, vehicle ID, etc.
-    data: Dict[str, Any] = field(default_factory=dict)
+    data: Any = None
 
-    def __lt__(self, other):
-        """Comparison for heap ordering."""
-        return self.time < other.time
+
+# Monotonic tie-breaker so heap entries never compare Event objects:
+# (time, seq) pairs are ordered entirely with C-level tuple comparison.
+_event_seq = itertools.count()
+
+# Stable ordinal per event type, resolved once so subscriber lookup is
+# a list index rather than hashing the enum's string value per event
+_EVENT_ORDINAL = {event_type: i for i, event_type in enumerate(EventType)}
 
 
 @dataclass
@@ -61,9 +95,22 @@ class SimulationEngine:
         if random_seed is not None:
             random.seed(random_seed)
 
-        self.event_queue: List[Event] = []
+        # Calendar queue: events bucketed by integer minute, with a small
+        # heap of occupied bucket keys. Insertion is O(1) amortized and
+        # extraction sorts each bucket once, which beats a single global
+        # heap when many events share nearby timestamps.
+        self.event_queue: Dict[int, List[Tuple[float, int, Event]]] = {}
+        self._bucket_keys: List[int] = []
+        # Bucket being dispatched right now: handlers scheduling into
+        # the current minute must land in this (sorted) list, after the
+        # event being processed, or dispatch order breaks
+        self._draining_key: Optional[int] = None
+        self._draining_bucket: Optional[List[Tuple[float, int, Event]]] = None
+        self._draining_pos: int = 0
         self.state = SimulationState()
-        self.callbacks: Dict[EventType, List[Callable]] = {}
+        # Subscriber buckets indexed by event-type ordinal: dispatch is
+        # one list index instead of a dict probe per event
+        self._subscribers: List[List[Callable]] = [[] for _ in EventType]
         self.random_seed = random_seed
 
     def schedule_event(self, event: Event) -> None:
@@ -72,7 +119,33 @@ class SimulationEngine:
         Args:
             event: Event to schedule
         """
-        heapq.heappush(self.event_queue, event)
+        bucket_key = int(event.time)
+        entry = (event.time, next(_event_seq), event)
+
+        # A handler scheduling into the minute being drained: bisect the
+        # entry into the sorted remainder (never before the in-flight
+        # event) so run() dispatches it in time order
+        if bucket_key == self._draining_key:
+            bisect.insort(
+                self._draining_bucket, entry, lo=self._draining_pos + 1
+            )
+            return
+
+        bucket = self.event_queue.get(bucket_key)
+        if bucket is None:
+            self.event_queue[bucket_key] = [entry]
+            heapq.heappush(self._bucket_keys, bucket_key)
+        else:
+            bucket.append(entry)
+
+    def schedule_events(self, events: List[Event]) -> None:
+        """Schedule multiple events at once.
+
+        Args:
+            events: Events to schedule
+        """
+        for event in events:
+            self.schedule_event(event)
 
     def subscribe(self, event_type: EventType, callback: Callable) -> None:
         """Subscribe to an event type.
@@ -81,9 +154,31 @@ class SimulationEngine:
             event_type: Type of event to subscribe to
             callback: Callback function(event) -> None
         """
-        if event_type not in self.callbacks:
-            self.callbacks[event_type] = []
-        self.callbacks[event_type].append(callback)
+        # Wrap once at subscribe time so the dispatch loop doesn't pay
+        # for a try/except frame per call
+        self._subscribers[_EVENT_ORDINAL[event_type]].append(
+            self._wrap_callback(callback, event_type)
+        )
+
+    @staticmethod
+    def _wrap_callback(callback: Callable, event_type: EventType) -> Callable:
+        """Wrap a callback so its errors are reported, not raised.
+
+        Args:
+            callback: Subscriber callback
+            event_type: Event type used in the error message
+
+        Returns:
+            Wrapped callback
+        """
+
+        def safe_callback(event: Event) -> None:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error in callback for {event_type}: {e}")
+
+        return safe_callback
 
     def _dispatch_event(self, event: Event) -> None:
         """Dispatch an event to subscribers.
@@ -91,12 +186,8 @@ class SimulationEngine:
         Args:
             event: Event to dispatch
         """
-        if event.event_type in self.callbacks:
-            for callback in self.callbacks[event.event_type]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    print(f"Error in callback for {event.event_type}: {e}")
+        for callback in self._subscribers[_EVENT_ORDINAL[event.event_type]]:
+            callback(event)
 
     def run(self, end_time: float) -> SimulationState:
         """Run simulation until end time.
@@ -119,15 +210,49 @@ class SimulationEngine:
                 )
             )
 
-        # Process events
-        while self.event_queue:
-            event = heapq.heappop(self.event_queue)
-
-            if event.time > end_time:
-                break
-
-            self.state.current_time = event.time
-            self._dispatch_event(event)
+        # Process buckets in time order; local aliases avoid attribute
+        # lookups in the loop
+        queue = self.event_queue
+        bucket_keys = self._bucket_keys
+        heappop = heapq.heappop
+        state = self.state
+
+        while bucket_keys:
+            bucket_key = heappop(bucket_keys)
+            bucket = queue.pop(bucket_key, None)
+            if not bucket:
+                continue
+
+            # One sort per bucket orders by (time, seq); handlers may
+            # grow the bucket mid-drain via schedule_event, so iterate
+            # by index rather than over a snapshot
+            bucket.sort()
+            self._draining_key = bucket_key
+            self._draining_bucket = bucket
+
+            entry_idx = 0
+            while entry_idx < len(bucket):
+                time, _, event = bucket[entry_idx]
+                if time > end_time:
+                    # Park the unprocessed tail back in the queue
+                    self._draining_key = None
+                    self._draining_bucket = None
+                    remainder = bucket[entry_idx:]
+                    existing = queue.get(bucket_key)
+                    if existing is None:
+                        queue[bucket_key] = remainder
+                        heapq.heappush(bucket_keys, bucket_key)
+                    else:
+                        existing.extend(remainder)
+                    return self.state
+
+                state.current_time = time
+                self._draining_pos = entry_idx
+                self._dispatch_event(event)
+                entry_idx += 1
+
+            self._draining_key = None
+            self._draining_bucket = None
 
         return self.state
 
@@ -147,7 +272,7 @@ class SimulationEngine:
             time=time,
             event_type=EventType.ORDER_ARRIVAL,
             entity_id=order_id,
-            data={"location": location, "weight": weight, "volume": volume},
+            data=OrderArrivalPayload(location, weight, volume),
         )
         self.schedule_event(event)
 
@@ -162,23 +287,24 @@ class SimulationEngine:
             vehicle_id: Vehicle identifier
             location: Pickup location (lat, lng)
         """
-        # Start event
-        event = Event(
-            time=time,
-            event_type=EventType.PICKUP_START,
-            entity_id=order_id,
-            data={"vehicle_id": vehicle_id, "location": location},
-        )
-        self.schedule_event(event)
-
-        # End event (15 minutes service time)
-        end_event = Event(
-            time=time + 15,
-            event_type=EventType.PICKUP_END,
-            entity_id=order_id,
-            data={"vehicle_id": vehicle_id},
+        # Start event plus end event (15 minutes service time),
+        # scheduled as one batch
+        self.schedule_events(
+            [
+                Event(
+                    time=time,
+                    event_type=EventType.PICKUP_START,
+                    entity_id=order_id,
+                    data=VehicleStopPayload(vehicle_id, location),
+                ),
+                Event(
+                    time=time + 15,
+                    event_type=EventType.PICKUP_END,
+                    entity_id=order_id,
+                    data=VehicleStopPayload(vehicle_id),
+                ),
+            ]
         )
-        self.schedule_event(end_event)
 
     def add_delivery_event(
         self, time: float, order_id: str, vehicle_id: str, location: tuple
@@ -191,23 +317,24 @@ class SimulationEngine:
             vehicle_id: Vehicle identifier
             location: Delivery location (lat, lng)
         """
-        # Start event
-        event = Event(
-            time=time,
-            event_type=EventType.DELIVERY_START,
-            entity_id=order_id,
-            data={"vehicle_id": vehicle_id, "location": location},
-        )
-        self.schedule_event(event)
-
-        # End event (30 minutes service time)
-        end_event = Event(
-            time=time + 30,
-            event_type=EventType.DELIVERY_END,
-            entity_id=order_id,
-            data={"vehicle_id": vehicle_id},
+        # Start event plus end event (30 minutes service time),
+        # scheduled as one batch
+        self.schedule_events(
+            [
+                Event(
+                    time=time,
+                    event_type=EventType.DELIVERY_START,
+                    entity_id=order_id,
+                    data=VehicleStopPayload(vehicle_id, location),
+                ),
+                Event(
+                    time=time + 30,
+                    event_type=EventType.DELIVERY_END,
+                    entity_id=order_id,
+                    data=VehicleStopPayload(vehicle_id),
+                ),
+            ]
         )
-        self.schedule_event(end_event)
 
     def get_state(self) -> SimulationState:
         """Get current simulation state.
@@ -217,9 +344,24 @@ class SimulationEngine:
         """
         return self.state
 
-    def reset(self) -> None:
-        """Reset simulation state."""
+    def reset(self, random_seed: Optional[int] = None) -> None:
+        """Reset simulation state for another run.
+
+        Clearing the queue, state and seed in place lets repeated
+        deterministic runs reuse one engine (and its subscriptions)
+        instead of rebuilding the object graph per run.
+
+        Args:
+            random_seed: New seed to apply; when omitted the engine's
+                original seed is reused
+        """
+        if random_seed is not None:
+            self.random_seed = random_seed
         self.state = SimulationState()
-        self.event_queue = []
+        self.event_queue = {}
+        self._bucket_keys = []
+        self._draining_key = None
+        self._draining_bucket = None
+        self._draining_pos = 0
         if self.random_seed is not None:
             random.seed(self.random_seed)
@@ -1,9 +1,38 @@
 """Simulation metrics calculation."""
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from datetime import datetime
 
+import numpy as np
+
+
+class DelayAccumulator:
+    """Streaming aggregate of order delays with O(1) memory.
+
+    Lets long simulations feed delays into calculate_metrics without
+    materializing a per-order list: update with add() as orders complete
+    and hand the accumulator in place of the delay list.
+    """
+
+    __slots__ = ("total", "count", "on_time")
+
+    def __init__(self):
+        self.total = 0.0
+        self.count = 0
+        self.on_time = 0
+
+    def add(self, delay_minutes: float) -> None:
+        """Record one completed order's delay.
+
+        Args:
+            delay_minutes: Delay in minutes (<= 0 counts as on time)
+        """
+        self.total += delay_minutes
+        self.count += 1
+        if delay_minutes <= 0:
+            self.on_time += 1
+
 
 @dataclass
 class SimulationMetrics:
@@ -35,7 +64,7 @@ class MetricsCalculator:
         total_orders: int,
         completed_orders: int,
         failed_orders: int,
-        order_delays: List[float],
+        order_delays: Union[List[float], DelayAccumulator],
         total_distance_km: float,
         total_vehicle_hours: float,
         vehicle_utilization: Dict[str, float],
@@ -47,7 +76,8 @@ class MetricsCalculator:
             total_orders: Total number of orders
             completed_orders: Number of completed orders
             failed_orders: Number of failed orders
-            order_delays: List of delays in minutes for each order
+            order_delays: Per-order delays in minutes, either a list or a
+                DelayAccumulator built during the simulation
             total_distance_km: Total distance traveled
             total_vehicle_hours: Total vehicle hours used
             vehicle_utilization: Dictionary of vehicle utilization
@@ -59,15 +89,29 @@ class MetricsCalculator:
         if total_orders == 0:
             total_orders = completed_orders + failed_orders
 
+        if isinstance(order_delays, DelayAccumulator):
+            avg_delay = (
+                order_delays.total / order_delays.count
+                if order_delays.count
+                else 0.0
+            )
+            if on_time_count is None:
+                on_time_count = order_delays.on_time
+        else:
+            # Large simulations hand in tens of thousands of delays; reduce
+            # them with a NumPy mean instead of a Python-level sum.
+            delays = np.asarray(order_delays, dtype=np.float64)
+            avg_delay = float(delays.mean()) if delays.size else 0.0
+            if on_time_count is None:
+                # Same threshold as DelayAccumulator: <= 0 is on time,
+                # counted in one vectorized compare
+                on_time_count = int(np.count_nonzero(delays <= 0))
+
         completion_rate = (completed_orders / total_orders * 100) if total_orders > 0 else 0
         on_time_percentage = (
             (on_time_count / completed_orders * 100) if completed_orders > 0 else 0
         )
 
-        avg_delay = 0.0
-        if order_delays:
-            avg_delay = sum(order_delays) / len(order_delays)
-
         # Calculate cost
         distance_cost = total_distance_km * MetricsCalculator.COST_PER_KM
         labor_cost = total_vehicle_hours * MetricsCalculator.COST_PER_HOUR
@@ -80,15 +124,18 @@ class MetricsCalculator:
         num_vehicles = len(vehicle_utilization) if vehicle_utilization else 1
         avg_orders = (completed_orders / num_vehicles) if num_vehicles > 0 else 0
 
+        # Values are stored unrounded; summary_report formats them for
+        # display. Skipping eight round() calls matters when metrics are
+        # rebuilt per timestep.
         return SimulationMetrics(
-            completion_rate=round(completion_rate, 2),
-            avg_delay_minutes=round(avg_delay, 2),
+            completion_rate=completion_rate,
+            avg_delay_minutes=avg_delay,
             vehicle_utilization=vehicle_utilization,
-            cost_per_delivery=round(cost_per_delivery, 2),
-            on_time_percentage=round(on_time_percentage, 2),
-            total_distance_km=round(total_distance_km, 2),
-            total_vehicle_hours=round(total_vehicle_hours, 2),
-            avg_orders_per_vehicle=round(avg_orders, 2),
+            cost_per_delivery=cost_per_delivery,
+            on_time_percentage=on_time_percentage,
+            total_distance_km=total_distance_km,
+            total_vehicle_hours=total_vehicle_hours,
+            avg_orders_per_vehicle=avg_orders,
             total_orders=total_orders,
             completed_orders=completed_orders,
             failed_orders=failed_orders,
@@ -132,17 +179,17 @@ class MetricsCalculator:
         report = f"""
 SIMULATION METRICS REPORT
 {'=' * 50}
-Orders Completed:         {metrics.completed_orders}/{metrics.total_orders} ({metrics.completion_rate}%)
+Orders Completed:         {metrics.completed_orders}/{metrics.total_orders} ({metrics.completion_rate:.2f}%)
 Failed Orders:            {metrics.failed_orders}
-On-Time Deliveries:       {metrics.on_time_percentage}%
-Average Delay:            {metrics.avg_delay_minutes} minutes
+On-Time Deliveries:       {metrics.on_time_percentage:.2f}%
+Average Delay:            {metrics.avg_delay_minutes:.2f} minutes
 
 OPERATIONAL METRICS
 {'=' * 50}
-Total Distance:           {metrics.total_distance_km} km
-Total Vehicle Hours:      {metrics.total_vehicle_hours} hours
-Avg Orders per Vehicle:   {metrics.avg_orders_per_vehicle}
-Cost per Delivery:        ${metrics.cost_per_delivery}
+Total Distance:           {metrics.total_distance_km:.2f} km
+Total Vehicle Hours:      {metrics.total_vehicle_hours:.2f} hours
+Avg Orders per Vehicle:   {metrics.avg_orders_per_vehicle:.2f}
+Cost per Delivery:        ${metrics.cost_per_delivery:.2f}
 
 VEHICLE UTILIZATION
 {'=' * 50}
@@ -1,10 +1,16 @@
 """Scenario generation for simulation."""
 
-import random
 from dataclasses import dataclass
-from typing import List, Tuple, Callable
+from typing import List, Optional, Tuple, Callable
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime
+
+import numpy as np
+
+# Shared default generator for batched draws; PCG64 is several times
+# faster per draw than the stdlib Mersenne Twister. Callers needing
+# reproducibility pass their own seeded Generator instead.
+_RNG = np.random.default_rng()
 
 
 class TimeDistribution(str, Enum):
@@ -23,6 +29,68 @@ class SizeDistribution(str, Enum):
     LARGE_LIGHT = "large_light"
 
 
+def _arrivals_uniform(
+    rng: np.random.Generator, n: int, simulation_minutes: float
+) -> np.ndarray:
+    """Sample arrival times uniformly over the simulation."""
+    return rng.uniform(0, simulation_minutes, n)
+
+
+def _arrivals_rush_hour(
+    rng: np.random.Generator, n: int, simulation_minutes: float
+) -> np.ndarray:
+    """Sample arrival times concentrated in 8-10 AM and 5-7 PM."""
+    morning = rng.integers(0, 2, n).astype(bool)
+    return np.where(
+        morning,
+        rng.uniform(8 * 60, 10 * 60, n),
+        rng.uniform(17 * 60, 19 * 60, n),
+    )
+
+
+def _arrivals_evening(
+    rng: np.random.Generator, n: int, simulation_minutes: float
+) -> np.ndarray:
+    """Sample arrival times between 5 PM and 10 PM."""
+    return rng.uniform(17 * 60, 22 * 60, n)
+
+
+def _sizes_uniform(
+    rng: np.random.Generator, n: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample (weights, volumes) across the full range."""
+    return rng.uniform(10, 100, n), rng.uniform(0.1, 2.0, n)
+
+
+def _sizes_small_heavy(
+    rng: np.random.Generator, n: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample (weights, volumes) for compact, heavy items."""
+    return rng.uniform(50, 150, n), rng.uniform(0.1, 0.5, n)
+
+
+def _sizes_large_light(
+    rng: np.random.Generator, n: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Sample (weights, volumes) for bulky, light items."""
+    return rng.uniform(5, 30, n), rng.uniform(1.0, 5.0, n)
+
+
+# Distribution dispatch resolved once per generate_orders call instead
+# of comparing enums per branch; each sampler is a pure batched draw
+_ARRIVAL_SAMPLERS = {
+    TimeDistribution.UNIFORM: _arrivals_uniform,
+    TimeDistribution.RUSH_HOUR: _arrivals_rush_hour,
+    TimeDistribution.EVENING: _arrivals_evening,
+}
+
+_SIZE_SAMPLERS = {
+    SizeDistribution.UNIFORM: _sizes_uniform,
+    SizeDistribution.SMALL_HEAVY: _sizes_small_heavy,
+    SizeDistribution.LARGE_LIGHT: _sizes_large_light,
+}
+
+
 @dataclass
 class Scenario:
     """Scenario configuration."""
@@ -46,6 +114,7 @@ class ScenarioGenerator:
         time_distribution: TimeDistribution = TimeDistribution.UNIFORM,
         size_distribution: SizeDistribution = SizeDistribution.UNIFORM,
         simulation_hours: float = 12.0,
+        rng: Optional[np.random.Generator] = None,
     ) -> List[dict]:
         """Generate orders for simulation.
 
@@ -55,58 +124,61 @@ class ScenarioGenerator:
             time_distribution: Type of time distribution
             size_distribution: Type of size distribution
             simulation_hours: Hours in simulation
+            rng: Random generator; pass a seeded np.random.default_rng
+                for reproducible scenarios (defaults to the module one)
 
         Returns:
             List of order dictionaries
         """
-        orders = []
+        if rng is None:
+            rng = _RNG
+
         min_lat, min_lng, max_lat, max_lng = area_bounds
         simulation_minutes = simulation_hours * 60
 
-        for i in range(num_orders):
-            # Generate location
-            pickup_lat = random.uniform(min_lat, max_lat)
-            pickup_lng = random.uniform(min_lng, max_lng)
-            delivery_lat = random.uniform(min_lat, max_lat)
-            delivery_lng = random.uniform(min_lng, max_lng)
-
-            # Generate arrival time
-            if time_distribution == TimeDistribution.UNIFORM:
-                arrival_time = random.uniform(0, simulation_minutes)
-            elif time_distribution == TimeDistribution.RUSH_HOUR:
-                # More orders between 8-10 AM and 5-7 PM
-                hour = random.choice(
-                    [random.uniform(8 * 60, 10 * 60), random.uniform(17 * 60, 19 * 60)]
-                )
-                arrival_time = hour
-            else:  # EVENING
-                arrival_time = random.uniform(17 * 60, 22 * 60)
-
-            # Generate size
-            if size_distribution == SizeDistribution.UNIFORM:
-                weight = random.uniform(10, 100)
-                volume = random.uniform(0.1, 2.0)
-            elif size_distribution == SizeDistribution.SMALL_HEAVY:
-                weight = random.uniform(50, 150)
-                volume = random.uniform(0.1, 0.5)
-            else:  # LARGE_LIGHT
-                weight = random.uniform(5, 30)
-                volume = random.uniform(1.0, 5.0)
-
-            # Time window (2-hour delivery window starting from arrival)
-            window_start = datetime.utcnow() + timedelta(minutes=arrival_time)
-            window_end = window_start + timedelta(hours=2)
+        # Batched C-level draws: one array per field instead of 5-7
+        # random.uniform calls per order
+        pickup_lats = rng.uniform(min_lat, max_lat, num_orders)
+        pickup_lngs = rng.uniform(min_lng, max_lng, num_orders)
+        delivery_lats = rng.uniform(min_lat, max_lat, num_orders)
+        delivery_lngs = rng.uniform(min_lng, max_lng, num_orders)
+
+        # Arrival times and sizes through the samplers resolved once
+        arrival_times = _ARRIVAL_SAMPLERS[time_distribution](
+            rng, num_orders, simulation_minutes
+        )
+        weights, volumes = _SIZE_SAMPLERS[size_distribution](rng, num_orders)
+
+        # Time window (2-hour delivery window starting from arrival),
+        # built as vectorized datetime64 arithmetic: one clock read and
+        # two array adds instead of per-order timedelta construction
+        now64 = np.datetime64(datetime.utcnow(), "us")
+        starts64 = now64 + (arrival_times * 60).astype("timedelta64[s]")
+        ends64 = starts64 + np.timedelta64(2, "h")
+
+        # Convert to plain Python objects once, outside the dict loop
+        pickup_lats = pickup_lats.tolist()
+        pickup_lngs = pickup_lngs.tolist()
+        delivery_lats = delivery_lats.tolist()
+        delivery_lngs = delivery_lngs.tolist()
+        weights = np.round(weights, 1).tolist()
+        volumes = np.round(volumes, 2).tolist()
+        arrival_times = arrival_times.tolist()
+        window_starts = starts64.tolist()
+        window_ends = ends64.tolist()
 
+        orders = []
+        for i in range(num_orders):
             orders.append(
                 {
                     "id": f"order_{i:05d}",
-                    "pickup_location": (pickup_lat, pickup_lng),
-                    "delivery_location": (delivery_lat, delivery_lng),
-                    "weight_kg": round(weight, 1),
-                    "volume_m3": round(volume, 2),
-                    "arrival_time_minutes": arrival_time,
-                    "time_window_start": window_start,
-                    "time_window_end": window_end,
+                    "pickup_location": (pickup_lats[i], pickup_lngs[i]),
+                    "delivery_location": (delivery_lats[i], delivery_lngs[i]),
+                    "weight_kg": weights[i],
+                    "volume_m3": volumes[i],
+                    "arrival_time_minutes": arrival_times[i],
+                    "time_window_start": window_starts[i],
+                    "time_window_end": window_ends[i],
                 }
             )
 
@@ -118,6 +190,7 @@ class ScenarioGenerator:
         depot_location: Tuple[float, float],
         max_weight_kg: float = 500.0,
         max_volume_m3: float = 10.0,
+        rng: Optional[np.random.Generator] = None,
     ) -> List[dict]:
         """Generate vehicles for simulation.
 
@@ -126,28 +199,34 @@ class ScenarioGenerator:
             depot_location: Depot location (lat, lng)
             max_weight_kg: Maximum weight capacity
             max_volume_m3: Maximum volume capacity
+            rng: Random generator; pass a seeded np.random.default_rng
+                for reproducible fleets (defaults to the module one)
 
         Returns:
             List of vehicle dictionaries
         """
-        vehicles = []
-
-        for i in range(num_vehicles):
-            # Slight variation in capacities (±10%)
-            weight = max_weight_kg * random.uniform(0.9, 1.1)
-            volume = max_volume_m3 * random.uniform(0.9, 1.1)
-
-            vehicles.append(
-                {
-                    "id": f"vehicle_{i:03d}",
-                    "max_weight_kg": round(weight, 1),
-                    "max_volume_m3": round(volume, 2),
-                    "start_location": depot_location,
-                    "end_location": depot_location,
-                }
-            )
-
-        return vehicles
+        if rng is None:
+            rng = _RNG
+
+        # Slight variation in capacities (±10%), drawn as two batched
+        # arrays instead of 2N scalar random.uniform calls
+        weights = np.round(
+            max_weight_kg * rng.uniform(0.9, 1.1, num_vehicles), 1
+        ).tolist()
+        volumes = np.round(
+            max_volume_m3 * rng.uniform(0.9, 1.1, num_vehicles), 2
+        ).tolist()
+
+        return [
+            {
+                "id": f"vehicle_{i:03d}",
+                "max_weight_kg": weights[i],
+                "max_volume_m3": volumes[i],
+                "start_location": depot_location,
+                "end_location": depot_location,
+            }
+            for i in range(num_vehicles)
+        ]
 
     @staticmethod
     def create_scenario(
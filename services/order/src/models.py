@@ -1,6 +1,6 @@
 """Pydantic models for order service."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 from typing import List, Tuple, Optional
 from enum import Enum
@@ -19,6 +19,10 @@ class OrderStatus(str, Enum):
 class TimeWindowModel(BaseModel):
     """Time window model."""
 
+    # Frozen models let pydantic-core skip mutability bookkeeping and
+    # makes instances hashable for caching
+    model_config = ConfigDict(frozen=True)
+
     earliest: datetime
     latest: datetime
 
@@ -32,15 +36,13 @@ class Order(BaseModel):
     time_window: TimeWindowModel
     weight_kg: float = Field(..., gt=0)
     volume_m3: float = Field(..., gt=0)
+    # Orders stay mutable: update_order_status rebinds status in place
+    model_config = ConfigDict(use_enum_values=True)
+
     status: OrderStatus = OrderStatus.PENDING
     created_at: datetime = Field(default_factory=datetime.utcnow)
     assigned_route_id: Optional[str] = None
 
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
-
 
 class Vehicle(BaseModel):
     """Vehicle model."""
@@ -56,6 +58,8 @@ class Vehicle(BaseModel):
 class Stop(BaseModel):
     """Stop in a route."""
 
+    model_config = ConfigDict(frozen=True)
+
     order_id: str
     location: Tuple[float, float]
     arrival_time_minutes: int
@@ -90,10 +94,7 @@ class OptimizationResult(BaseModel):
     unassigned_orders: List[str]
     total_distance_km: float
     total_vehicle_hours: float
+    model_config = ConfigDict(use_enum_values=True)
+
     optimization_time_seconds: float
     algorithm: str = "nearest_neighbor_2opt"
-
-    class Config:
-        """Pydantic config."""
-
-        use_enum_values = True
@@ -0,0 +1,124 @@
+"""Ahead-of-time build recipe for the Haversine kernels.
+
+Running ``python -m services.routing.src._haversine_native_build`` (or
+calling :func:`build` from a CI step) compiles the kernels into a native
+``_haversine_native`` extension next to this file. When the extension is
+present, :mod:`.distance` binds to it at import and skips JIT warmup
+entirely — useful for short-lived request handlers where even a cached
+numba compile shows up in first-request latency. Without the extension
+nothing changes: the JIT kernels in :mod:`.distance` remain the default.
+"""
+
+import numpy as np
+
+from numba.pycc import CC
+
+EARTH_RADIUS_KM = 6371.0
+
+cc = CC("_haversine_native")
+
+
+@cc.export("haversine_scalar", "f8(f8, f8, f8, f8)")
+def haversine_scalar(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Scalar Haversine; mirrors distance._haversine.
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lng1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lng2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1_rad = np.radians(lat1)
+    lng1_rad = np.radians(lng1)
+    lat2_rad = np.radians(lat2)
+    lng2_rad = np.radians(lng2)
+
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+    )
+    a = min(a, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+@cc.export("haversine_many", "f4[:](f8, f8, f4[:], f4[:])")
+def haversine_many(
+    lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray
+) -> np.ndarray:
+    """One-to-many Haversine; mirrors distance._haversine_many.
+
+    Args:
+        lat: Reference latitude (degrees)
+        lng: Reference longitude (degrees)
+        lats: Latitudes of the other points (degrees)
+        lngs: Longitudes of the other points (degrees)
+
+    Returns:
+        Distance array in kilometers
+    """
+    lat_rad = np.radians(lat)
+    lng_rad = np.radians(lng)
+    cos_lat = np.cos(lat_rad)
+
+    out = np.empty_like(lats)
+    for i in range(lats.shape[0]):
+        lat2_rad = np.radians(lats[i])
+        dlat = lat2_rad - lat_rad
+        dlng = np.radians(lngs[i]) - lng_rad
+        a = (
+            np.sin(dlat / 2) ** 2
+            + cos_lat * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+        )
+        a = min(a, 1.0)
+        out[i] = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+    return out
+
+
+@cc.export("build_matrix", "void(f4[:], f4[:], f4[:], f4[:, :])")
+def build_matrix(
+    lats_rad: np.ndarray,
+    lngs_rad: np.ndarray,
+    cos_lats: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Fill a Haversine matrix in place; mirrors distance._build_haversine_matrix.
+
+    AOT compilation does not support prange, so this variant is serial;
+    when numba itself is installed the JIT parallel builder is preferred.
+
+    Args:
+        lats_rad: Latitudes in radians
+        lngs_rad: Longitudes in radians
+        cos_lats: Precomputed cos(lat) values
+        out: Preallocated (N, N) output matrix (diagonal left as-is)
+    """
+    n = lats_rad.shape[0]
+    for i in range(n):
+        for j in range(i + 1, n):
+            dlat = lats_rad[j] - lats_rad[i]
+            dlng = lngs_rad[j] - lngs_rad[i]
+            a = (
+                np.sin(dlat * 0.5) ** 2
+                + cos_lats[i] * cos_lats[j] * np.sin(dlng * 0.5) ** 2
+            )
+            a = min(a, 1.0)
+            d = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+            out[i, j] = d
+            out[j, i] = d
+
+
+def build() -> None:
+    """Compile the exported kernels into the native extension."""
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
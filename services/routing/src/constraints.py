@@ -1,17 +1,69 @@
 """Constraint definitions and validation for routing."""
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, Set
-from dataclasses import dataclass
+from typing import Callable, List, Tuple, Optional, Set, Union
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
+import numpy as np
 
-@dataclass
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator used when numba is not installed."""
+
+        def wrapper(func):
+            return func
+
+        return wrapper
+
+
+@njit(cache=True, fastmath=True)
+def _validate_capacity(
+    weights: np.ndarray, volumes: np.ndarray, max_weight: float, max_volume: float
+) -> bool:
+    """Compiled running-sum capacity check with early exit.
+
+    Args:
+        weights: Per-stop weights in kg
+        volumes: Per-stop volumes in m³
+        max_weight: Maximum weight capacity in kg
+        max_volume: Maximum volume capacity in m³
+
+    Returns:
+        True if the cumulative load never exceeds either capacity
+    """
+    total_weight = 0.0
+    total_volume = 0.0
+    for i in range(weights.shape[0]):
+        total_weight += weights[i]
+        if total_weight > max_weight:
+            return False
+        total_volume += volumes[i]
+        if total_volume > max_volume:
+            return False
+    return True
+
+
+@dataclass(slots=True)
 class TimeWindow:
     """Time window constraint: earliest and latest delivery times."""
 
     earliest: datetime
     latest: datetime
+    # Minute-of-day bounds precomputed once; validators compare plain
+    # ints instead of walking datetime attributes per stop
+    earliest_min_of_day: int = field(init=False)
+    latest_min_of_day: int = field(init=False)
+
+    def __post_init__(self):
+        self.earliest_min_of_day = self.earliest.hour * 60 + self.earliest.minute
+        self.latest_min_of_day = self.latest.hour * 60 + self.latest.minute
 
     def contains(self, time: datetime) -> bool:
         """Check if time is within the window."""
@@ -51,28 +103,44 @@ class VehicleCapacityConstraint(Constraint):
         self.max_weight_kg = max_weight_kg
         self.max_volume_m3 = max_volume_m3
 
-    def validate(self, route_loads: List[Tuple[float, float]]) -> bool:
+    def validate(
+        self, route_loads: Union[List[Tuple[float, float]], np.ndarray]
+    ) -> bool:
         """Validate that route loads don't exceed capacity.
 
         Args:
-            route_loads: List of (weight_kg, volume_m3) tuples
+            route_loads: (weight_kg, volume_m3) pairs as a tuple list or
+                an (n, 2) array; passing an array skips the conversion
 
         Returns:
             True if all loads are within capacity
         """
-        total_weight = 0.0
-        total_volume = 0.0
+        if len(route_loads) == 0:
+            return True
 
-        for weight, volume in route_loads:
-            total_weight += weight
-            total_volume += volume
+        loads = np.asarray(route_loads, dtype=np.float64)
+        return self.validate_arrays(
+            np.ascontiguousarray(loads[:, 0]), np.ascontiguousarray(loads[:, 1])
+        )
 
-            if total_weight > self.max_weight_kg:
-                return False
-            if total_volume > self.max_volume_m3:
-                return False
+    def validate_arrays(self, weights: np.ndarray, volumes: np.ndarray) -> bool:
+        """Validate capacity over SoA weight/volume arrays.
 
-        return True
+        Callers that already hold parallel float64 arrays skip the
+        tuple-list conversion in validate().
+
+        Args:
+            weights: Per-stop weights in kg
+            volumes: Per-stop volumes in m³
+
+        Returns:
+            True if all loads are within capacity
+        """
+        return bool(
+            _validate_capacity(
+                weights, volumes, self.max_weight_kg, self.max_volume_m3
+            )
+        )
 
 
 class TimeWindowConstraint(Constraint):
@@ -85,6 +153,48 @@ class TimeWindowConstraint(Constraint):
             service_time_minutes: Service time at each location in minutes
         """
         self.service_time_minutes = service_time_minutes
+        self._windows_key: Optional[Tuple[Tuple[int, int], ...]] = None
+        self._earliest_arr: Optional[np.ndarray] = None
+        self._latest_arr: Optional[np.ndarray] = None
+        self._uniform_bounds: Optional[Tuple[int, int]] = None
+
+    def _window_bounds(
+        self, time_windows: List[TimeWindow]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Get (earliest, latest) minute-of-day arrays for the windows.
+
+        The arrays are cached keyed on the window bounds themselves, so
+        repeated validations of candidate orderings against the same
+        route don't redo the array building — and callers that mutate a
+        window list in place still get fresh bounds.
+
+        Args:
+            time_windows: List of TimeWindow objects
+
+        Returns:
+            (earliest_min, latest_min) int32 arrays
+        """
+        key = tuple(
+            (tw.earliest_min_of_day, tw.latest_min_of_day)
+            for tw in time_windows
+        )
+        if key != self._windows_key:
+            n = len(time_windows)
+            self._earliest_arr = np.fromiter(
+                (bounds[0] for bounds in key), dtype=np.int32, count=n
+            )
+            self._latest_arr = np.fromiter(
+                (bounds[1] for bounds in key), dtype=np.int32, count=n
+            )
+            # Routes commonly carry one shared delivery window for every
+            # stop; remember the scalar bounds so validate can skip the
+            # per-stop array compare entirely
+            if n and all(bounds == key[0] for bounds in key):
+                self._uniform_bounds = key[0]
+            else:
+                self._uniform_bounds = None
+            self._windows_key = key
+        return self._earliest_arr, self._latest_arr
 
     def validate(
         self,
@@ -102,18 +212,28 @@ class TimeWindowConstraint(Constraint):
         Returns:
             True if all arrivals are within time windows
         """
-        for i, (tw, arrival_min) in enumerate(zip(time_windows, arrival_times)):
-            arrival_time = start_time + arrival_min
-            # Convert to minutes from midnight for comparison
-            earliest_min = tw.earliest.hour * 60 + tw.earliest.minute
-            latest_min = tw.latest.hour * 60 + tw.latest.minute
-
-            # Allow for arrival within window (within a day)
-            arrival_min_of_day = arrival_time % (24 * 60)
-            if arrival_min_of_day > latest_min or arrival_min_of_day < earliest_min:
-                return False
+        if not time_windows or not arrival_times:
+            return True
 
-        return True
+        earliest, latest = self._window_bounds(time_windows)
+
+        # Minutes from midnight, one vectorized compare over the route
+        # instead of per-stop modulo and branches
+        n = min(len(time_windows), len(arrival_times))
+        arrivals = (
+            np.asarray(arrival_times[:n], dtype=np.int64) + start_time
+        ) % (24 * 60)
+
+        # Identical windows across the route reduce to two scalar
+        # compares against the extreme arrivals; no boolean array is
+        # materialized
+        if self._uniform_bounds is not None:
+            e, l = self._uniform_bounds
+            return bool(e <= arrivals.min() and arrivals.max() <= l)
+
+        return bool(
+            ((arrivals >= earliest[:n]) & (arrivals <= latest[:n])).all()
+        )
 
 
 class DriverHoursConstraint(Constraint):
@@ -135,6 +255,12 @@ class DriverHoursConstraint(Constraint):
         self.max_shift_hours = max_shift_hours
         self.mandatory_break_hours = mandatory_break_hours
         self.break_after_hours = break_after_hours
+        # Minute thresholds hoisted once; validate runs in the
+        # optimizer's candidate loop and compares minutes directly
+        # instead of converting hours per call
+        self._max_shift_min = max_shift_hours * 60.0
+        self._break_after_min = break_after_hours * 60.0
+        self._mand_break_min = mandatory_break_hours * 60.0
 
     def validate(self, total_time_minutes: int, driving_time_minutes: int) -> bool:
         """Validate driver hours constraints.
@@ -146,48 +272,102 @@ class DriverHoursConstraint(Constraint):
         Returns:
             True if driver hour constraints are satisfied
         """
-        total_hours = total_time_minutes / 60.0
-        driving_hours = driving_time_minutes / 60.0
-
         # Check max shift
-        if total_hours > self.max_shift_hours:
+        if total_time_minutes > self._max_shift_min:
             return False
 
-        # Check if break is needed
-        if driving_hours > self.break_after_hours:
-            min_total_with_break = (
-                driving_hours + self.mandatory_break_hours
-            ) * 60
-            if total_time_minutes < min_total_with_break:
+        # Check if break is needed: the route must leave room for the
+        # mandatory break on top of the driving time
+        if driving_time_minutes > self._break_after_min:
+            if total_time_minutes < driving_time_minutes + self._mand_break_min:
                 return False
 
         return True
 
 
+class ZoneRegistry:
+    """Interns zone names to bit positions for mask-based checks.
+
+    Python ints are arbitrary precision, so the mask transparently
+    grows past 64 zones without extra words.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._bits: dict = {}
+
+    def intern(self, zone: str) -> int:
+        """Get the bit for a zone, assigning one on first sight.
+
+        Args:
+            zone: Zone identifier
+
+        Returns:
+            Single-bit int unique to the zone
+        """
+        bit = self._bits.get(zone)
+        if bit is None:
+            bit = 1 << len(self._bits)
+            self._bits[zone] = bit
+        return bit
+
+    def mask(self, zones) -> int:
+        """Fold a collection of zone names into one bitmask.
+
+        Args:
+            zones: Iterable of zone identifiers
+
+        Returns:
+            Bitwise OR of each zone's bit
+        """
+        result = 0
+        for zone in zones:
+            result |= self.intern(zone)
+        return result
+
+
 class ZoneRestrictionConstraint(Constraint):
     """Validates geographic zone restrictions."""
 
-    def __init__(self, excluded_zones: Set[str]):
+    def __init__(
+        self, excluded_zones: Set[str], registry: Optional[ZoneRegistry] = None
+    ):
         """Initialize zone restriction constraint.
 
         Args:
             excluded_zones: Set of zone IDs that are excluded
+            registry: Zone name interner; share one across constraints
+                so callers can pre-mask routes (a fresh registry is
+                created when omitted)
         """
         self.excluded_zones = excluded_zones
+        self.registry = registry if registry is not None else ZoneRegistry()
+        # Precomputed once: validation against an int mask is a single
+        # AND instead of a hash probe per zone
+        self._excluded_mask = self.registry.mask(excluded_zones)
 
-    def validate(self, zones: List[str]) -> bool:
+    def validate(self, zones: Union[List[str], int]) -> bool:
         """Validate that no locations are in excluded zones.
 
         Args:
-            zones: List of zone IDs for each location
+            zones: List of zone IDs for each location, or a bitmask
+                already folded through this constraint's registry
 
         Returns:
             True if no zone is excluded
         """
-        for zone in zones:
-            if zone in self.excluded_zones:
-                return False
-        return True
+        if isinstance(zones, int):
+            return (zones & self._excluded_mask) == 0
+        return (self.registry.mask(zones) & self._excluded_mask) == 0
+
+
+# Shared default-parameter instance for ConstraintChecker: check_* used
+# to build a fresh constraint per call, which is a pure allocation tax
+# inside the optimizer's candidate loop. DriverHoursConstraint is
+# stateless after __init__ so one module-level instance is safe;
+# TimeWindowConstraint carries a mutable bounds cache and is therefore
+# per-checker.
+_DEFAULT_DRIVER_HOURS_CONSTRAINT = DriverHoursConstraint()
 
 
 class ConstraintChecker:
@@ -196,6 +376,8 @@ class ConstraintChecker:
     def __init__(self):
         """Initialize constraint checker."""
         self.constraints: List[Constraint] = []
+        self._compiled: dict = {}
+        self._time_window_constraint = TimeWindowConstraint()
 
     def add_constraint(self, constraint: Constraint) -> None:
         """Add a constraint to the checker.
@@ -205,21 +387,84 @@ class ConstraintChecker:
         """
         self.constraints.append(constraint)
 
+    def compile_check(
+        self,
+        max_weight_kg: float,
+        max_volume_m3: float,
+        excluded_zones: Set[str] = frozenset(),
+    ) -> Callable[..., bool]:
+        """Build a fused feasibility check specialized for one vehicle.
+
+        The returned closure binds the capacity limits, zone set and
+        kernel into local cells, so evaluating a candidate route is one
+        call with no attribute lookups or per-constraint dispatch.
+        Compiled checks are cached per parameter set.
+
+        Args:
+            max_weight_kg: Max weight in kg
+            max_volume_m3: Max volume in m³
+            excluded_zones: Zone IDs the vehicle may not enter
+
+        Returns:
+            check(route_loads, zones=()) -> bool
+        """
+        key = (max_weight_kg, max_volume_m3, frozenset(excluded_zones))
+        check = self._compiled.get(key)
+        if check is not None:
+            return check
+
+        excluded = key[2]
+        validate_capacity = _validate_capacity
+
+        def check(route_loads, zones=()) -> bool:
+            if excluded and not excluded.isdisjoint(zones):
+                return False
+            if len(route_loads) == 0:
+                return True
+            loads = np.asarray(route_loads, dtype=np.float64)
+            return bool(
+                validate_capacity(
+                    np.ascontiguousarray(loads[:, 0]),
+                    np.ascontiguousarray(loads[:, 1]),
+                    max_weight_kg,
+                    max_volume_m3,
+                )
+            )
+
+        self._compiled[key] = check
+        return check
+
     def check_capacity(
-        self, max_weight_kg: float, max_volume_m3: float, route_loads: List[Tuple[float, float]]
+        self,
+        max_weight_kg: float,
+        max_volume_m3: float,
+        route_loads: Union[List[Tuple[float, float]], np.ndarray],
     ) -> bool:
         """Check capacity constraint.
 
         Args:
             max_weight_kg: Max weight in kg
             max_volume_m3: Max volume in m³
-            route_loads: List of (weight, volume) tuples
+            route_loads: (weight, volume) pairs as a tuple list or an
+                (n, 2) array
 
         Returns:
             True if capacity is not exceeded
         """
-        constraint = VehicleCapacityConstraint(max_weight_kg, max_volume_m3)
-        return constraint.validate(route_loads)
+        # Feed the compiled kernel directly: no constraint object, no
+        # method dispatch, just the array conversion and the C loop
+        if len(route_loads) == 0:
+            return True
+
+        loads = np.asarray(route_loads, dtype=np.float64)
+        return bool(
+            _validate_capacity(
+                np.ascontiguousarray(loads[:, 0]),
+                np.ascontiguousarray(loads[:, 1]),
+                max_weight_kg,
+                max_volume_m3,
+            )
+        )
 
     def check_time_windows(
         self,
@@ -237,8 +482,9 @@ class ConstraintChecker:
         Returns:
             True if all time windows are met
         """
-        constraint = TimeWindowConstraint()
-        return constraint.validate(time_windows, arrival_times, start_time)
+        return self._time_window_constraint.validate(
+            time_windows, arrival_times, start_time
+        )
 
     def check_driver_hours(
         self, total_time_minutes: int, driving_time_minutes: int
@@ -252,8 +498,9 @@ class ConstraintChecker:
         Returns:
             True if driver hour constraints are met
         """
-        constraint = DriverHoursConstraint()
-        return constraint.validate(total_time_minutes, driving_time_minutes)
+        return _DEFAULT_DRIVER_HOURS_CONSTRAINT.validate(
+            total_time_minutes, driving_time_minutes
+        )
 
     def check_zones(self, zones: List[str], excluded_zones: Set[str]) -> bool:
         """Check zone restrictions.
@@ -265,5 +512,6 @@ class ConstraintChecker:
         Returns:
             True if no excluded zones are visited
         """
-        constraint = ZoneRestrictionConstraint(excluded_zones)
-        return constraint.validate(zones)
+        # The membership test is the whole constraint; skip the wrapper
+        # object and check directly
+        return not any(zone in excluded_zones for zone in zones)
@@ -1,14 +1,279 @@
 """Distance matrix computation using Haversine formula."""
 
 import math
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Union
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op decorator used when numba is not installed."""
+
+        def wrapper(func):
+            return func
+
+        return wrapper
+
+
+try:
+    # Optional AOT extension produced by _haversine_native_build; loads
+    # as a plain C extension with zero warmup and no numba runtime
+    from . import _haversine_native as _native
+
+    AOT_AVAILABLE = True
+except ImportError:  # pragma: no cover - extension is a CI build artifact
+    _native = None
+    AOT_AVAILABLE = False
+
+
+EARTH_RADIUS_KM = 6371.0
+
+# GPS coordinates carry ~6 significant digits, so single precision is
+# plenty at delivery scale (sub-metre error) while doubling SIMD lane
+# count and halving memory traffic in the matrix build. Route-length
+# accumulators stay in Python floats (double) to avoid drift.
+DISTANCE_DTYPE = np.float32
+
+
+@njit(cache=True, fastmath=True)
+def _haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Scalar Haversine kernel (JIT-compiled when numba is available).
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lng1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lng2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1_rad = np.radians(lat1)
+    lng1_rad = np.radians(lng1)
+    lat2_rad = np.radians(lat2)
+    lng2_rad = np.radians(lng2)
+
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+    )
+    # atan2 form is stable near antipodes where arcsin(sqrt(a)) loses
+    # precision, and vectorizes identically; the clamp guards against
+    # rounding nudging a just past 1
+    a = min(a, 1.0)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+    return EARTH_RADIUS_KM * c
+
+
+@njit(cache=True, fastmath=True)
+def _haversine_many(
+    lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray
+) -> np.ndarray:
+    """One-to-many Haversine kernel over SoA coordinate arrays.
+
+    Args:
+        lat: Reference latitude (degrees)
+        lng: Reference longitude (degrees)
+        lats: Latitudes of the other points (degrees)
+        lngs: Longitudes of the other points (degrees)
+
+    Returns:
+        Distance array in kilometers
+    """
+    lat_rad = np.radians(lat)
+    lng_rad = np.radians(lng)
+    cos_lat = np.cos(lat_rad)
+
+    out = np.empty_like(lats)
+    for i in range(lats.shape[0]):
+        lat2_rad = np.radians(lats[i])
+        dlat = lat2_rad - lat_rad
+        dlng = np.radians(lngs[i]) - lng_rad
+        a = (
+            np.sin(dlat / 2) ** 2
+            + cos_lat * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+        )
+        a = min(a, 1.0)
+        out[i] = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _build_haversine_matrix(
+    lats_rad: np.ndarray,
+    lngs_rad: np.ndarray,
+    cos_lats: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Fill a full Haversine matrix in place, fused and threaded.
+
+    Writing matrix[i, j] directly avoids the five O(N^2) temporaries a
+    broadcast expression allocates; the upper-triangle loop halves the
+    trig work and prange spreads rows across cores.
+
+    Args:
+        lats_rad: Latitudes in radians
+        lngs_rad: Longitudes in radians
+        cos_lats: Precomputed cos(lat) values
+        out: Preallocated (N, N) output matrix (diagonal left as-is)
+    """
+    n = lats_rad.shape[0]
+    for i in prange(n):
+        for j in range(i + 1, n):
+            dlat = lats_rad[j] - lats_rad[i]
+            dlng = lngs_rad[j] - lngs_rad[i]
+            a = (
+                np.sin(dlat * 0.5) ** 2
+                + cos_lats[i] * cos_lats[j] * np.sin(dlng * 0.5) ** 2
+            )
+            a = min(a, 1.0)
+            d = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+            out[i, j] = d
+            out[j, i] = d
+
+
+# Below this size the prange thread fork costs more than the trig it
+# spreads; the serial kernel's straight inner loop also lets LLVM keep
+# the whole working set in registers for typical depot+stops fleets
+_SMALL_MATRIX_N = 64
+
+
+@njit(cache=True, fastmath=True)
+def _build_haversine_matrix_small(
+    lats_rad: np.ndarray,
+    lngs_rad: np.ndarray,
+    cos_lats: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    """Serial variant of _build_haversine_matrix for small N.
+
+    Args:
+        lats_rad: Latitudes in radians
+        lngs_rad: Longitudes in radians
+        cos_lats: Precomputed cos(lat) values
+        out: Preallocated (N, N) output matrix (diagonal left as-is)
+    """
+    n = lats_rad.shape[0]
+    for i in range(n):
+        for j in range(i + 1, n):
+            dlat = lats_rad[j] - lats_rad[i]
+            dlng = lngs_rad[j] - lngs_rad[i]
+            a = (
+                np.sin(dlat * 0.5) ** 2
+                + cos_lats[i] * cos_lats[j] * np.sin(dlng * 0.5) ** 2
+            )
+            a = min(a, 1.0)
+            d = 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+            out[i, j] = d
+            out[j, i] = d
+
+
+if AOT_AVAILABLE:
+    # The pre-built extension needs no warmup; bind the hot names to it
+    _haversine = _native.haversine_scalar
+    _haversine_many = _native.haversine_many
+elif NUMBA_AVAILABLE:
+    # Warm the JIT cache at import time so the one-off compile cost
+    # doesn't land inside the optimizer's first distance query
+    _haversine(0.0, 0.0, 0.0, 0.0)
+    _haversine_many(0.0, 0.0, np.zeros(1, DISTANCE_DTYPE), np.zeros(1, DISTANCE_DTYPE))
+
+if NUMBA_AVAILABLE:
+    # Only the serial builder is warmed at import: compiling the
+    # parallel one starts numba's threading layer, which poisons any
+    # fork()ed worker created after this module is imported. The
+    # parallel kernel compiles lazily on its first >_SMALL_MATRIX_N
+    # call instead (and loads from the on-disk cache after that).
+    _build_haversine_matrix_small(
+        np.zeros(2, DISTANCE_DTYPE),
+        np.zeros(2, DISTANCE_DTYPE),
+        np.ones(2, DISTANCE_DTYPE),
+        np.zeros((2, 2), DISTANCE_DTYPE),
+    )
+
+
+class LocationSet:
+    """Struct-of-arrays view of (lat, lng) points with precomputed trig.
+
+    Converting the tuple list to contiguous column arrays once — with
+    radians and cos(lat) baked in at construction — lets every distance
+    query against the set run as packed vector ops instead of unboxing
+    tuples per point.
+    """
+
+    __slots__ = ("lats", "lngs", "lats_rad", "lngs_rad", "cos_lat", "_cache_key")
+
+    def __init__(
+        self, locations: Union[List[Tuple[float, float]], np.ndarray]
+    ):
+        """Build the prepared arrays.
+
+        Args:
+            locations: List of (latitude, longitude) tuples or an (N,2)
+                array
+        """
+        coords = np.asarray(locations, dtype=DISTANCE_DTYPE).reshape(-1, 2)
+        self.lats = np.ascontiguousarray(coords[:, 0])
+        self.lngs = np.ascontiguousarray(coords[:, 1])
+        self.lats_rad = np.radians(self.lats)
+        self.lngs_rad = np.radians(self.lngs)
+        self.cos_lat = np.cos(self.lats_rad)
+        self._cache_key: Optional[bytes] = None
+
+    @property
+    def cache_key(self) -> bytes:
+        """Hashable key identifying the coordinate data.
+
+        Computed from the raw array bytes the first time it is asked
+        for and reused afterwards, so repeated cache lookups against
+        the same set amortize to a dict probe.
+        """
+        if self._cache_key is None:
+            self._cache_key = self.lats.tobytes() + self.lngs.tobytes()
+        return self._cache_key
+
+    def __len__(self) -> int:
+        """Number of points in the set."""
+        return self.lats.shape[0]
+
+    def distances_from(self, lat: float, lng: float) -> np.ndarray:
+        """Haversine distances from one point to every point in the set.
+
+        Args:
+            lat: Reference latitude (degrees)
+            lng: Reference longitude (degrees)
+
+        Returns:
+            Distance array in kilometers
+        """
+        lat_rad = math.radians(lat)
+        lng_rad = math.radians(lng)
+
+        dlat = self.lats_rad - lat_rad
+        dlng = self.lngs_rad - lng_rad
+        a = (
+            np.sin(dlat / 2) ** 2
+            + math.cos(lat_rad) * self.cos_lat * np.sin(dlng / 2) ** 2
+        )
+        np.clip(a, 0.0, 1.0, out=a)
+        return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
 
 class DistanceMatrix:
     """Compute and cache distance matrices between locations."""
 
-    EARTH_RADIUS_KM = 6371.0
+    EARTH_RADIUS_KM = EARTH_RADIUS_KM
 
     def __init__(self, use_cache: bool = False):
         """Initialize distance matrix.
@@ -32,47 +297,77 @@ class DistanceMatrix:
         Returns:
             Distance in kilometers
         """
-        lat1_rad = math.radians(lat1)
-        lng1_rad = math.radians(lng1)
-        lat2_rad = math.radians(lat2)
-        lng2_rad = math.radians(lng2)
-
-        dlat = lat2_rad - lat1_rad
-        dlng = lng2_rad - lng1_rad
-
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2
-        )
-        c = 2 * math.asin(math.sqrt(a))
-
-        return DistanceMatrix.EARTH_RADIUS_KM * c
+        return float(_haversine(lat1, lng1, lat2, lng2))
 
     def compute_distance_matrix(
-        self, locations: List[Tuple[float, float]]
+        self, locations: Union[List[Tuple[float, float]], LocationSet]
     ) -> np.ndarray:
-        """Compute distance matrix for a list of locations.
+        """Compute distance matrix for a set of locations.
 
         Args:
-            locations: List of (latitude, longitude) tuples
+            locations: List of (latitude, longitude) tuples, or an
+                already-built LocationSet (whose byte-level cache key
+                is then reused instead of rehashing the coordinates)
 
         Returns:
             NxN distance matrix where matrix[i][j] is distance from location i to j
         """
-        cache_key = tuple(locations)
-        if self.use_cache and cache_key in self._cache:
-            return self._cache[cache_key]
+        locs = (
+            locations
+            if isinstance(locations, LocationSet)
+            else LocationSet(locations)
+        )
+
+        # Key construction is gated behind use_cache so the non-cached
+        # hot path never hashes the coordinates; with a shared
+        # LocationSet the key bytes are built once and reused
+        if self.use_cache:
+            cache_key = locs.cache_key
+            if cache_key in self._cache:
+                return self._cache[cache_key]
+
+        n = len(locs)
+        if n == 0:
+            return np.zeros((0, 0))
 
-        n = len(locations)
-        matrix = np.zeros((n, n))
+        if NUMBA_AVAILABLE:
+            # Fused kernel fills the matrix in place over the upper
+            # triangle with no O(N^2) temporaries; small fleets take
+            # the serial specialization to skip the thread fork
+            matrix = np.zeros((n, n), dtype=DISTANCE_DTYPE)
+            if n <= _SMALL_MATRIX_N:
+                _build_haversine_matrix_small(
+                    locs.lats_rad, locs.lngs_rad, locs.cos_lat, matrix
+                )
+            else:
+                _build_haversine_matrix(
+                    locs.lats_rad, locs.lngs_rad, locs.cos_lat, matrix
+                )
+        elif AOT_AVAILABLE:
+            # Serial native builder: no numba runtime required
+            matrix = np.zeros((n, n), dtype=DISTANCE_DTYPE)
+            _native.build_matrix(
+                locs.lats_rad, locs.lngs_rad, locs.cos_lat, matrix
+            )
+        else:
+            # Broadcast fallback: (N,1) vs (1,N) column/row views, trig
+            # evaluated in NumPy's C loops. LocationSet already holds
+            # radians and cos(lat).
+            lat = locs.lats_rad[:, None]
+            lng = locs.lngs_rad[:, None]
+            cos_lat = locs.cos_lat[:, None]
 
-        for i in range(n):
-            for j in range(i + 1, n):
-                lat1, lng1 = locations[i]
-                lat2, lng2 = locations[j]
-                distance = self.haversine(lat1, lng1, lat2, lng2)
-                matrix[i][j] = distance
-                matrix[j][i] = distance
+            dlat = lat - lat.T
+            dlng = lng - lng.T
+            a = (
+                np.sin(dlat / 2) ** 2
+                + cos_lat * cos_lat.T * np.sin(dlng / 2) ** 2
+            )
+            matrix = 2 * self.EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+            # Rounding in the broadcast math can leave tiny nonzero
+            # values on the diagonal
+            np.fill_diagonal(matrix, 0.0)
 
         if self.use_cache:
             self._cache[cache_key] = matrix
@@ -97,7 +392,7 @@ class DistanceMatrix:
         self, locations: List[Tuple[float, float]], center: Tuple[float, float],
         radius_km: float
     ) -> List[int]:
-        """Find locations within bounding box of given radius.
+        """Find locations within a radius, using a bounding-box prefilter.
 
         Args:
             locations: List of (latitude, longitude) tuples
@@ -107,19 +402,28 @@ class DistanceMatrix:
         Returns:
             List of indices of locations within radius
         """
+        if not locations:
+            return []
+
         # Rough approximation: 1 degree latitude ≈ 111 km
         lat_delta = radius_km / 111.0
         lng_delta = radius_km / (111.0 * math.cos(math.radians(center[0])))
 
-        result = []
-        for i, (lat, lng) in enumerate(locations):
-            if (
-                abs(lat - center[0]) <= lat_delta
-                and abs(lng - center[1]) <= lng_delta
-            ):
-                result.append(i)
+        # Box test as fused elementwise ops over the SoA arrays, then an
+        # exact Haversine check on the few candidates that survive: the
+        # box is only a prefilter, so the result is true radius hits
+        locs = LocationSet(locations)
+        mask = (np.abs(locs.lats - center[0]) <= lat_delta) & (
+            np.abs(locs.lngs - center[1]) <= lng_delta
+        )
+        candidates = np.nonzero(mask)[0]
+        if candidates.size == 0:
+            return []
 
-        return result
+        distances = _haversine_many(
+            center[0], center[1], locs.lats[candidates], locs.lngs[candidates]
+        )
+        return candidates[distances <= radius_km].tolist()
 
     def clear_cache(self) -> None:
         """Clear the distance cache."""
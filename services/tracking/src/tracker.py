@@ -1,9 +1,121 @@
 """Vehicle tracking and ETA calculation."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from functools import lru_cache
+from typing import Dict, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
-import math
+import logging
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator used when numba is not installed."""
+
+        def wrapper(func):
+            return func
+
+        return wrapper
+
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+
+@njit(cache=True, fastmath=True)
+def _haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Scalar Haversine kernel (JIT-compiled when numba is available).
+
+    Args:
+        lat1: Latitude of first point (degrees)
+        lng1: Longitude of first point (degrees)
+        lat2: Latitude of second point (degrees)
+        lng2: Longitude of second point (degrees)
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1_rad = np.radians(lat1)
+    lng1_rad = np.radians(lng1)
+    lat2_rad = np.radians(lat2)
+    lng2_rad = np.radians(lng2)
+
+    dlat = lat2_rad - lat1_rad
+    dlng = lng2_rad - lng1_rad
+
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+    )
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
+
+
+@njit(cache=True, fastmath=True)
+def _haversine_pair(
+    lats1: np.ndarray, lngs1: np.ndarray, lats2: np.ndarray, lngs2: np.ndarray
+) -> np.ndarray:
+    """Elementwise Haversine kernel over paired coordinate arrays.
+
+    Args:
+        lats1: Latitudes of the first points (degrees)
+        lngs1: Longitudes of the first points (degrees)
+        lats2: Latitudes of the second points (degrees)
+        lngs2: Longitudes of the second points (degrees)
+
+    Returns:
+        Distance array in kilometers, one entry per pair
+    """
+    out = np.empty(lats1.shape[0], dtype=np.float64)
+    for i in range(lats1.shape[0]):
+        lat1_rad = np.radians(lats1[i])
+        lat2_rad = np.radians(lats2[i])
+        dlat = lat2_rad - lat1_rad
+        dlng = np.radians(lngs2[i]) - np.radians(lngs1[i])
+        a = (
+            np.sin(dlat / 2) ** 2
+            + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlng / 2) ** 2
+        )
+        out[i] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    return out
+
+
+if NUMBA_AVAILABLE:
+    # Warm the JIT cache at import time so the one-off compile cost
+    # doesn't land inside the first ETA calculation
+    _haversine(0.0, 0.0, 0.0, 0.0)
+    _haversine_pair(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1))
+
+
+@lru_cache(maxsize=4096)
+def _cached_haversine(
+    lat1_q: float, lng1_q: float, lat2_q: float, lng2_q: float
+) -> float:
+    """Memoized scalar Haversine over quantized coordinates.
+
+    Position feeds tick many times per second against a handful of
+    discrete stop locations; with inputs rounded to ~10 m a vehicle
+    idling at a light hits this cache on every tick instead of
+    re-evaluating the trig.
+
+    Args:
+        lat1_q: Quantized latitude of first point (degrees)
+        lng1_q: Quantized longitude of first point (degrees)
+        lat2_q: Quantized latitude of second point (degrees)
+        lng2_q: Quantized longitude of second point (degrees)
+
+    Returns:
+        Distance in kilometers
+    """
+    return float(_haversine(lat1_q, lng1_q, lat2_q, lng2_q))
 
 
 @dataclass
@@ -41,6 +153,21 @@ class VehicleTracker:
         self.positions: Dict[str, VehiclePosition] = {}
         self.routes: Dict[str, List[StopInfo]] = {}
         self.callbacks: List[Callable] = []
+        # Dispatch tuples rebuilt on registration: trusted callbacks
+        # run bare (no per-call exception frame), untrusted ones keep
+        # the guard; tuples iterate faster than lists in the hot loop
+        self._trusted_callbacks: Tuple[Callable, ...] = ()
+        self._untrusted_callbacks: Tuple[Callable, ...] = ()
+        # Cumulative travel minutes from stop 0 to stop i along each
+        # route; stop-to-stop legs depend only on the registered stops,
+        # so the table is built once per route and every per-stop ETA
+        # afterwards is the position leg plus a prefix difference
+        self._eta_prefix: Dict[str, np.ndarray] = {}
+        # order_id -> stop index per vehicle, plus a cursor at the
+        # first pending stop, so event handlers and ETA queries jump
+        # straight to their stop instead of scanning the route
+        self._stop_index: Dict[str, Dict[str, int]] = {}
+        self._next_pending: Dict[str, int] = {}
 
     def update_position(self, position: VehiclePosition) -> None:
         """Update vehicle position.
@@ -51,6 +178,20 @@ class VehicleTracker:
         self.positions[position.vehicle_id] = position
         self._emit_event("position_updated", position)
 
+    def update_position_bulk(self, positions: List[VehiclePosition]) -> None:
+        """Update many vehicle positions with one aggregate event.
+
+        High-frequency feeds that push whole fleet snapshots avoid N
+        per-vehicle callback rounds; listeners receive a single
+        "positions_updated" event carrying the list.
+
+        Args:
+            positions: Updated vehicle positions
+        """
+        for position in positions:
+            self.positions[position.vehicle_id] = position
+        self._emit_event("positions_updated", positions)
+
     def register_route(self, vehicle_id: str, stops: List[StopInfo]) -> None:
         """Register a route for a vehicle.
 
@@ -59,6 +200,50 @@ class VehicleTracker:
             stops: List of delivery stops
         """
         self.routes[vehicle_id] = stops
+        self._eta_prefix[vehicle_id] = self._build_eta_prefix(stops)
+        self._stop_index[vehicle_id] = {
+            stop.order_id: i for i, stop in enumerate(stops)
+        }
+        self._next_pending[vehicle_id] = self._first_pending(stops, 0)
+
+    @staticmethod
+    def _first_pending(stops: List[StopInfo], start: int) -> int:
+        """Find the first pending stop at or after an index.
+
+        Args:
+            stops: List of delivery stops
+            start: Index to start scanning from
+
+        Returns:
+            Index of the first pending stop, or 0 if none remain
+            (matching the historical fallback of the ETA scan)
+        """
+        for i in range(start, len(stops)):
+            if stops[i].status == "pending":
+                return i
+        return 0
+
+    def _build_eta_prefix(self, stops: List[StopInfo]) -> np.ndarray:
+        """Build the cumulative travel-minute table for a route.
+
+        Args:
+            stops: List of delivery stops
+
+        Returns:
+            Array where entry i is travel minutes from stop 0 to stop i
+        """
+        n = len(stops)
+        prefix = np.zeros(n)
+        if n > 1:
+            lats = np.fromiter(
+                (stop.location[0] for stop in stops), dtype=np.float64, count=n
+            )
+            lngs = np.fromiter(
+                (stop.location[1] for stop in stops), dtype=np.float64, count=n
+            )
+            legs = _haversine_pair(lats[:-1], lngs[:-1], lats[1:], lngs[1:])
+            np.cumsum(legs / self.AVG_SPEED_KMH * 60, out=prefix[1:])
+        return prefix
 
     def get_position(self, vehicle_id: str) -> Optional[VehiclePosition]:
         """Get current position of a vehicle.
@@ -91,31 +276,69 @@ class VehicleTracker:
         if not stops:
             return None
 
-        # Find next pending stop
-        next_stop_idx = 0
-        for i, stop in enumerate(stops):
-            if stop.status == "pending":
-                next_stop_idx = i
-                break
-
-        total_minutes = 0
-        current_location = (position.latitude, position.longitude)
+        next_stop_idx = self._next_pending[vehicle_id]
 
-        # Calculate time to remaining stops
-        for i in range(next_stop_idx, len(stops)):
-            stop = stops[i]
-
-            # Distance to this stop
-            distance = self._haversine_distance(current_location, stop.location)
+        # One leg from the current position, then prefix differences
+        # for the stop-to-stop legs: no per-stop Haversine loop
+        prefix = self._eta_prefix[vehicle_id]
+        leg0 = self._haversine_distance(
+            (position.latitude, position.longitude),
+            stops[next_stop_idx].location,
+        )
+        total_minutes = (
+            (leg0 / self.AVG_SPEED_KMH) * 60
+            + (prefix[-1] - prefix[next_stop_idx])
+            + self.SERVICE_TIME_MINUTES * (len(stops) - next_stop_idx)
+        )
 
-            # Travel time
-            travel_minutes = (distance / self.AVG_SPEED_KMH) * 60
+        return datetime.utcnow() + timedelta(minutes=total_minutes)
 
-            total_minutes += travel_minutes + self.SERVICE_TIME_MINUTES
+    def calculate_all_etas(self) -> Dict[str, datetime]:
+        """Calculate completion ETAs for every tracked vehicle at once.
 
-            current_location = stop.location
+        All current-position-to-next-stop legs go through a single
+        paired-array Haversine call instead of one Python loop per
+        vehicle; the remaining route legs come from the cached prefix
+        tables.
 
-        return datetime.utcnow() + timedelta(minutes=total_minutes)
+        Returns:
+            Mapping of vehicle_id to estimated completion time, for
+            vehicles that have both a position and a non-empty route
+        """
+        vids = [
+            vid
+            for vid, stops in self.routes.items()
+            if stops and vid in self.positions
+        ]
+        if not vids:
+            return {}
+
+        n = len(vids)
+        pos_lats = np.empty(n)
+        pos_lngs = np.empty(n)
+        stop_lats = np.empty(n)
+        stop_lngs = np.empty(n)
+        rest_minutes = np.empty(n)
+        for i, vid in enumerate(vids):
+            position = self.positions[vid]
+            stops = self.routes[vid]
+            next_stop_idx = self._next_pending[vid]
+            prefix = self._eta_prefix[vid]
+            pos_lats[i] = position.latitude
+            pos_lngs[i] = position.longitude
+            stop_lats[i], stop_lngs[i] = stops[next_stop_idx].location
+            rest_minutes[i] = (prefix[-1] - prefix[next_stop_idx]) + (
+                self.SERVICE_TIME_MINUTES * (len(stops) - next_stop_idx)
+            )
+
+        leg0 = _haversine_pair(pos_lats, pos_lngs, stop_lats, stop_lngs)
+        totals = (leg0 / self.AVG_SPEED_KMH) * 60 + rest_minutes
+
+        now = datetime.utcnow()
+        return {
+            vid: now + timedelta(minutes=minutes)
+            for vid, minutes in zip(vids, totals.tolist())
+        }
 
     def calculate_eta_to_stop(
         self, vehicle_id: str, order_id: str
@@ -138,35 +361,26 @@ class VehicleTracker:
 
         stops = self.routes[vehicle_id]
 
-        # Find the stop
-        target_stop_idx = None
-        for i, stop in enumerate(stops):
-            if stop.order_id == order_id:
-                target_stop_idx = i
-                break
-
+        target_stop_idx = self._stop_index[vehicle_id].get(order_id)
         if target_stop_idx is None:
             return None
 
-        total_minutes = 0
-        current_location = (position.latitude, position.longitude)
-
-        # Calculate time to target stop
-        for i in range(target_stop_idx + 1):
-            stop = stops[i]
-
-            # Distance to this stop
-            distance = self._haversine_distance(current_location, stop.location)
-
-            # Travel time
-            travel_minutes = (distance / self.AVG_SPEED_KMH) * 60
+        # The vehicle travels from its current position to the next
+        # pending stop, then along the route to the target
+        next_stop_idx = min(self._next_pending[vehicle_id], target_stop_idx)
 
-            if i < target_stop_idx:
-                total_minutes += travel_minutes + self.SERVICE_TIME_MINUTES
-            else:
-                total_minutes += travel_minutes
-
-            current_location = stop.location
+        # One Haversine for the position leg; the rest is a prefix
+        # difference plus service time at the intermediate stops
+        prefix = self._eta_prefix[vehicle_id]
+        leg0 = self._haversine_distance(
+            (position.latitude, position.longitude),
+            stops[next_stop_idx].location,
+        )
+        total_minutes = (
+            (leg0 / self.AVG_SPEED_KMH) * 60
+            + (prefix[target_stop_idx] - prefix[next_stop_idx])
+            + self.SERVICE_TIME_MINUTES * (target_stop_idx - next_stop_idx)
+        )
 
         return datetime.utcnow() + timedelta(minutes=total_minutes)
 
@@ -180,13 +394,18 @@ class VehicleTracker:
         if vehicle_id not in self.routes:
             return
 
+        idx = self._stop_index[vehicle_id].get(order_id)
+        if idx is None:
+            return
+
         stops = self.routes[vehicle_id]
-        for stop in stops:
-            if stop.order_id == order_id:
-                stop.status = "completed"
-                stop.departure_time = datetime.utcnow()
-                self._emit_event("stop_completed", (vehicle_id, order_id))
-                break
+        stops[idx].status = "completed"
+        stops[idx].departure_time = datetime.utcnow()
+        # Advancing from the old cursor is amortized O(1) over the
+        # route's lifetime
+        if idx == self._next_pending[vehicle_id]:
+            self._next_pending[vehicle_id] = self._first_pending(stops, idx + 1)
+        self._emit_event("stop_completed", (vehicle_id, order_id))
 
     def mark_stop_arrived(self, vehicle_id: str, order_id: str) -> None:
         """Mark a stop as arrived.
@@ -198,13 +417,16 @@ class VehicleTracker:
         if vehicle_id not in self.routes:
             return
 
+        idx = self._stop_index[vehicle_id].get(order_id)
+        if idx is None:
+            return
+
         stops = self.routes[vehicle_id]
-        for stop in stops:
-            if stop.order_id == order_id:
-                stop.status = "arrived"
-                stop.arrival_time = datetime.utcnow()
-                self._emit_event("stop_arrived", (vehicle_id, order_id))
-                break
+        stops[idx].status = "arrived"
+        stops[idx].arrival_time = datetime.utcnow()
+        if idx == self._next_pending[vehicle_id]:
+            self._next_pending[vehicle_id] = self._first_pending(stops, idx + 1)
+        self._emit_event("stop_arrived", (vehicle_id, order_id))
 
     def get_vehicle_stops(self, vehicle_id: str) -> List[StopInfo]:
         """Get all stops for a vehicle.
@@ -217,13 +439,19 @@ class VehicleTracker:
         """
         return self.routes.get(vehicle_id, [])
 
-    def register_callback(self, callback: Callable) -> None:
+    def register_callback(self, callback: Callable, trusted: bool = False) -> None:
         """Register a callback for tracking events.
 
         Args:
             callback: Callback function that receives (event_type, data)
+            trusted: If True the callback runs without an exception
+                guard; only for callbacks known not to raise
         """
         self.callbacks.append(callback)
+        if trusted:
+            self._trusted_callbacks += (callback,)
+        else:
+            self._untrusted_callbacks += (callback,)
 
     def _emit_event(self, event_type: str, data: any) -> None:
         """Emit a tracking event.
@@ -232,11 +460,16 @@ class VehicleTracker:
             event_type: Type of event
             data: Event data
         """
-        for callback in self.callbacks:
+        for callback in self._trusted_callbacks:
+            callback(event_type, data)
+        for callback in self._untrusted_callbacks:
             try:
                 callback(event_type, data)
-            except Exception as e:
-                print(f"Error in callback: {e}")
+            except Exception:
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.exception(
+                        "Error in tracking callback for %s", event_type
+                    )
 
     @staticmethod
     def _haversine_distance(loc1: tuple, loc2: tuple) -> float:
@@ -247,23 +480,11 @@ class VehicleTracker:
             loc2: (latitude, longitude) tuple
 
         Returns:
-            Distance in kilometers
+            Distance in kilometers (from ~10 m-quantized inputs)
         """
-        lat1, lng1 = loc1
-        lat2, lng2 = loc2
-
-        lat1_rad = math.radians(lat1)
-        lng1_rad = math.radians(lng1)
-        lat2_rad = math.radians(lat2)
-        lng2_rad = math.radians(lng2)
-
-        dlat = lat2_rad - lat1_rad
-        dlng = lng2_rad - lng1_rad
-
-        a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2
+        # 4 decimal places ≈ 11 m: close enough for ETA legs, coarse
+        # enough that consecutive ticks of a near-stationary vehicle
+        # collapse onto one cache entry
+        return _cached_haversine(
+            round(loc1[0], 4), round(loc1[1], 4), round(loc2[0], 4), round(loc2[1], 4)
         )
-        c = 2 * math.asin(math.sqrt(a))
-
-        return VehicleTracker.EARTH_RADIUS_KM * c
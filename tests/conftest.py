@@ -0,0 +1,8 @@
+"""Shared test configuration."""
+
+import sys
+import os
+
+# Repo root on sys.path once, before collection; the test modules import
+# services/packages directly without repeating the path mutation
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -1,12 +1,8 @@
 """Tests for constraint validation."""
 
 import pytest
+import numpy as np
 from datetime import datetime, timedelta
-import sys
-import os
-
-# Add src directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from services.routing.src.constraints import (
     VehicleCapacityConstraint,
@@ -28,29 +24,32 @@ class TestVehicleCapacityConstraint:
         )
         assert constraint.validate([]) is True
 
-    def test_within_capacity_passes(self):
-        """Test route within capacity passes."""
+    @pytest.mark.parametrize(
+        "max_weight,max_volume,expected",
+        [
+            pytest.param(500.0, 10.0, True, id="within-capacity"),
+            pytest.param(300.0, 10.0, False, id="exceeds-weight"),
+            pytest.param(500.0, 5.0, False, id="exceeds-volume"),
+        ],
+    )
+    def test_capacity_limits(self, max_weight, max_volume, expected):
+        """Test capacity validation against weight and volume limits."""
         constraint = VehicleCapacityConstraint(
-            max_weight_kg=500.0, max_volume_m3=10.0
+            max_weight_kg=max_weight, max_volume_m3=max_volume
         )
         route_loads = [(100.0, 2.0), (150.0, 3.0), (100.0, 2.0)]
-        assert constraint.validate(route_loads) is True
+        assert constraint.validate(route_loads) is expected
 
-    def test_exceed_weight_fails(self):
-        """Test route exceeding weight capacity fails."""
+    def test_ndarray_loads_supported(self):
+        """Test that loads can be passed as an (n, 2) array directly."""
         constraint = VehicleCapacityConstraint(
             max_weight_kg=300.0, max_volume_m3=10.0
         )
-        route_loads = [(100.0, 2.0), (150.0, 3.0), (100.0, 2.0)]
-        assert constraint.validate(route_loads) is False
-
-    def test_exceed_volume_fails(self):
-        """Test route exceeding volume capacity fails."""
-        constraint = VehicleCapacityConstraint(
-            max_weight_kg=500.0, max_volume_m3=5.0
-        )
-        route_loads = [(100.0, 2.0), (150.0, 3.0), (100.0, 2.0)]
-        assert constraint.validate(route_loads) is False
+        within = np.array([(100.0, 2.0), (150.0, 3.0)])
+        over = np.array([(100.0, 2.0), (150.0, 3.0), (100.0, 2.0)])
+        assert constraint.validate(within) is True
+        assert constraint.validate(over) is False
+        assert constraint.validate(np.empty((0, 2))) is True
 
     def test_exactly_at_capacity_passes(self):
         """Test route at exact capacity passes."""
@@ -64,53 +63,28 @@ class TestVehicleCapacityConstraint:
 class TestTimeWindowConstraint:
     """Test time window constraint."""
 
-    def test_arrival_within_window_passes(self):
-        """Test arrival within time window passes."""
+    @pytest.mark.parametrize(
+        "arrival_times,expected",
+        [
+            pytest.param([500, 600], True, id="within-window"),  # 8:20 AM, 10 AM
+            pytest.param([1200], False, id="after-window"),  # 8:00 PM
+            pytest.param([300], False, id="before-window"),  # 5:00 AM
+        ],
+    )
+    def test_arrival_against_window(self, arrival_times, expected):
+        """Test arrivals inside, after and before an 8 AM-6 PM window."""
         constraint = TimeWindowConstraint()
 
         now = datetime.utcnow()
         morning = now.replace(hour=8, minute=0)
         evening = now.replace(hour=18, minute=0)
 
+        # One window per arrival (in minutes of day)
         time_windows = [
-            TimeWindow(earliest=morning, latest=evening),
-            TimeWindow(earliest=morning, latest=evening),
+            TimeWindow(earliest=morning, latest=evening) for _ in arrival_times
         ]
 
-        # Arrival times within window (in minutes of day)
-        arrival_times = [500, 600]  # 8:20 AM, 10:00 AM
-
-        assert constraint.validate(time_windows, arrival_times) is True
-
-    def test_arrival_after_window_fails(self):
-        """Test arrival after time window fails."""
-        constraint = TimeWindowConstraint()
-
-        now = datetime.utcnow()
-        morning = now.replace(hour=8, minute=0)
-        evening = now.replace(hour=18, minute=0)
-
-        time_windows = [TimeWindow(earliest=morning, latest=evening)]
-
-        # Arrival time after window (in minutes of day)
-        arrival_times = [1200]  # 8:00 PM (20:00)
-
-        assert constraint.validate(time_windows, arrival_times) is False
-
-    def test_arrival_before_window_fails(self):
-        """Test arrival before time window fails."""
-        constraint = TimeWindowConstraint()
-
-        now = datetime.utcnow()
-        morning = now.replace(hour=8, minute=0)
-        evening = now.replace(hour=18, minute=0)
-
-        time_windows = [TimeWindow(earliest=morning, latest=evening)]
-
-        # Arrival time before window (in minutes of day)
-        arrival_times = [300]  # 5:00 AM
-
-        assert constraint.validate(time_windows, arrival_times) is False
+        assert constraint.validate(time_windows, arrival_times) is expected
 
 
 class TestDriverHoursConstraint:
@@ -159,28 +133,47 @@ class TestDriverHoursConstraint:
 class TestZoneRestrictionConstraint:
     """Test zone restriction constraint."""
 
-    def test_allowed_zones_pass(self):
-        """Test allowed zones pass."""
-        constraint = ZoneRestrictionConstraint(excluded_zones={"restricted_zone"})
-        zones = ["zone_a", "zone_b", "zone_c"]
-        assert constraint.validate(zones) is True
-
-    def test_excluded_zones_fail(self):
-        """Test excluded zones fail."""
-        constraint = ZoneRestrictionConstraint(excluded_zones={"restricted_zone"})
-        zones = ["zone_a", "restricted_zone", "zone_c"]
-        assert constraint.validate(zones) is False
-
-    def test_multiple_excluded_zones(self):
-        """Test multiple excluded zones."""
-        constraint = ZoneRestrictionConstraint(
-            excluded_zones={"zone_a", "zone_b"}
-        )
-        zones = ["zone_c", "zone_d", "zone_e"]
-        assert constraint.validate(zones) is True
-
-        zones = ["zone_c", "zone_a", "zone_e"]
-        assert constraint.validate(zones) is False
+    @pytest.mark.parametrize(
+        "excluded,zones,expected",
+        [
+            pytest.param(
+                {"restricted_zone"},
+                ["zone_a", "zone_b", "zone_c"],
+                True,
+                id="all-allowed",
+            ),
+            pytest.param(
+                {"restricted_zone"},
+                ["zone_a", "restricted_zone", "zone_c"],
+                False,
+                id="one-excluded",
+            ),
+            pytest.param(
+                {"zone_a", "zone_b"},
+                ["zone_c", "zone_d", "zone_e"],
+                True,
+                id="multiple-excluded-allowed",
+            ),
+            pytest.param(
+                {"zone_a", "zone_b"},
+                ["zone_c", "zone_a", "zone_e"],
+                False,
+                id="multiple-excluded-hit",
+            ),
+        ],
+    )
+    def test_zone_restrictions(self, excluded, zones, expected):
+        """Test zone lists against excluded-zone sets."""
+        constraint = ZoneRestrictionConstraint(excluded_zones=excluded)
+        assert constraint.validate(zones) is expected
+
+    def test_premasked_zones(self):
+        """Test validation against a precomputed zone bitmask."""
+        constraint = ZoneRestrictionConstraint(excluded_zones={"restricted"})
+        ok_mask = constraint.registry.mask(["zone_a", "zone_b"])
+        bad_mask = constraint.registry.mask(["zone_a", "restricted"])
+        assert constraint.validate(ok_mask) is True
+        assert constraint.validate(bad_mask) is False
 
 
 class TestConstraintChecker:
@@ -208,6 +201,23 @@ class TestConstraintChecker:
             is False
         )
 
+    def test_compiled_check(self):
+        """Test specialized checks are cached and validate correctly."""
+        checker = ConstraintChecker()
+
+        check = checker.compile_check(
+            max_weight_kg=300.0,
+            max_volume_m3=10.0,
+            excluded_zones={"restricted"},
+        )
+        # Same parameters return the same compiled check
+        assert checker.compile_check(300.0, 10.0, {"restricted"}) is check
+
+        assert check([(100.0, 2.0), (150.0, 3.0)], zones=["zone_a"]) is True
+        assert check([(100.0, 2.0), (250.0, 3.0)], zones=["zone_a"]) is False
+        assert check([(100.0, 2.0)], zones=["restricted"]) is False
+        assert check([]) is True
+
     def test_driver_hours_check(self):
         """Test driver hours constraint checking."""
         checker = ConstraintChecker()
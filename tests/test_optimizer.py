@@ -1,16 +1,30 @@
 """Tests for route optimizer."""
 
 import pytest
+from dataclasses import replace
 from datetime import datetime, timedelta
-import sys
-import os
-
-# Add src directories to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from services.routing.src.optimizer import RouteOptimizer, Order, Vehicle
 from services.routing.src.constraints import TimeWindow
 
+# Prebuilt templates: tests stamp out batches with dataclasses.replace,
+# so each test only spells the fields that vary and the shared defaults
+# live in one place
+_ORDER_TEMPLATE = Order(
+    id="",
+    pickup_location=(0.0, 0.0),
+    delivery_location=(0.0, 0.0),
+    time_window=None,
+    weight_kg=0.0,
+    volume_m3=0.0,
+)
+_VEHICLE_TEMPLATE = Vehicle(
+    id="",
+    max_weight_kg=100.0,
+    max_volume_m3=2.0,
+    start_location=(40.7128, -74.0060),
+)
+
 
 class TestRouteOptimizer:
     """Test cases for RouteOptimizer."""
@@ -71,7 +85,8 @@ class TestRouteOptimizer:
     def test_multiple_orders_single_vehicle(self, optimizer, simple_vehicle, time_window):
         """Test that multiple orders can be assigned to single vehicle."""
         orders = [
-            Order(
+            replace(
+                _ORDER_TEMPLATE,
                 id=f"o{i}",
                 pickup_location=(40.7130 + i * 0.001, -74.0060),
                 delivery_location=(40.7200 + i * 0.001, -74.0150),
@@ -90,16 +105,12 @@ class TestRouteOptimizer:
 
     def test_capacity_constraint_respected(self, optimizer, time_window):
         """Test that vehicle capacity constraints are respected."""
-        vehicle = Vehicle(
-            id="v1",
-            max_weight_kg=100.0,
-            max_volume_m3=2.0,
-            start_location=(40.7128, -74.0060),
-        )
+        vehicle = replace(_VEHICLE_TEMPLATE, id="v1")
 
         # Create orders that would exceed capacity if all assigned to one vehicle
         orders = [
-            Order(
+            replace(
+                _ORDER_TEMPLATE,
                 id=f"o{i}",
                 pickup_location=(40.7130 + i * 0.001, -74.0060),
                 delivery_location=(40.7200 + i * 0.001, -74.0150),
@@ -137,7 +148,8 @@ class TestRouteOptimizer:
     def test_2opt_improvement(self, optimizer, simple_vehicle, time_window):
         """Test that 2-opt improvement is applied."""
         orders = [
-            Order(
+            replace(
+                _ORDER_TEMPLATE,
                 id=f"o{i}",
                 pickup_location=(40.7130 + i * 0.002, -74.0060),
                 delivery_location=(40.7200 + i * 0.002, -74.0150),
@@ -164,18 +176,11 @@ class TestRouteOptimizer:
 
     def test_multiple_vehicles_distribute_orders(self, optimizer, time_window):
         """Test that multiple vehicles distribute orders."""
-        vehicles = [
-            Vehicle(
-                id=f"v{i}",
-                max_weight_kg=100.0,
-                max_volume_m3=2.0,
-                start_location=(40.7128, -74.0060),
-            )
-            for i in range(2)
-        ]
+        vehicles = [replace(_VEHICLE_TEMPLATE, id=f"v{i}") for i in range(2)]
 
         orders = [
-            Order(
+            replace(
+                _ORDER_TEMPLATE,
                 id=f"o{i}",
                 pickup_location=(40.7130 + i * 0.001, -74.0060),
                 delivery_location=(40.7200 + i * 0.001, -74.0150),
@@ -194,7 +199,8 @@ class TestRouteOptimizer:
     def test_route_stops_in_order(self, optimizer, simple_vehicle, time_window):
         """Test that stops in a route are assigned in valid order."""
         orders = [
-            Order(
+            replace(
+                _ORDER_TEMPLATE,
                 id=f"o{i}",
                 pickup_location=(40.7130 + i * 0.001, -74.0060),
                 delivery_location=(40.7200 + i * 0.001, -74.0150),